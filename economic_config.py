@@ -1,4 +1,5 @@
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -7,7 +8,15 @@ load_dotenv()
 class EconomicConfig:
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
     FRED_API_KEY = os.getenv("FRED_API_KEY")
-    DEFAULT_MODEL = "gpt-4"
+    DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "gpt-4")
+    # o-series reasoning models reject any sampling temperature other than their default
+    FIXED_TEMPERATURE_MODEL_PREFIXES = ("o1", "o3", "o4")
+    # OpenAI service tier; "flex" trades slower responses for batch pricing on offline runs.
+    # Flex is only offered for o3, o4-mini and gpt-5 models (set DEFAULT_MODEL) and is ignored for others
+    OPENAI_SERVICE_TIER = os.getenv("OPENAI_SERVICE_TIER")
+    # Concurrent LLM requests allowed per run, and attempts on rate-limit/transient errors
+    LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "10"))
+    LLM_MAX_RETRIES = 6
     
     # Economic analysis parameters
     DEFAULT_PERIOD = "5y"  # 10 years for economic trends
@@ -46,13 +55,31 @@ class EconomicConfig:
         "NATURAL_GAS": "DHHNGSP",             # Henry Hub Natural Gas Spot Price
     }
     
+    # Seconds a fetched FRED series is reused before fetching it again
+    DATA_CACHE_TTL = int(os.getenv("DATA_CACHE_TTL", "3600"))
+    # Directory keeping fetched series between runs; set to an empty string to disable
+    DATA_CACHE_DIR = os.getenv("DATA_CACHE_DIR", "economic_cache/fred_series")
+    # SQLite file caching LLM responses by prompt hash; set to an empty string to disable
+    LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "economic_cache/llm_responses.sqlite")
+    # Seconds a cached LLM response is reused; expired responses are purged on the next write
+    LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "86400"))
+    
     # Report settings
     REPORT_OUTPUT_DIR = "economic_reports"
     CHART_OUTPUT_DIR = "economic_charts"
+    # Set RENDER_CHARTS=0 for headless runs that only need the analysis and report
+    RENDER_CHARTS = os.getenv("RENDER_CHARTS", "1") == "1"
+    # Chart file format; "svg" skips rasterization and is much faster to write than 300 dpi PNG
+    CHART_FORMAT = os.getenv("CHART_FORMAT", "png").lower()
     
     # Analysis focus areas
     FOCUS_INDUSTRIES = ["tech", "healthcare", "energy"]
     
+    @classmethod
+    def model_temperature(cls, temperature: float):
+        """Sampling temperature to request from DEFAULT_MODEL, or None to use the model's default"""
+        return None if cls.DEFAULT_MODEL.startswith(cls.FIXED_TEMPERATURE_MODEL_PREFIXES) else temperature
+    
     @classmethod
     def validate(cls):
         if not cls.OPENAI_API_KEY:
@@ -61,5 +88,5 @@ class EconomicConfig:
             raise ValueError("FRED_API_KEY environment variable is required")
         
         # Create output directories if they don't exist
-        os.makedirs(cls.REPORT_OUTPUT_DIR, exist_ok=True)
-        os.makedirs(cls.CHART_OUTPUT_DIR, exist_ok=True)
\ No newline at end of file
+        Path(cls.REPORT_OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
+        Path(cls.CHART_OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
\ No newline at end of file
@@ -1,16 +1,20 @@
 from fredapi import Fred
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional
+import json
+import os
+import time
+import uuid
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+from pathlib import Path
 from economic_config import EconomicConfig
 
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
 @dataclass
 class EconomicData:
     """Data structure to hold economic information"""
@@ -22,6 +26,10 @@ class EconomicData:
     last_updated: datetime
     notes: str
     
+    def __bool__(self) -> bool:
+        """Treat a series with no observations as missing"""
+        return self.data is not None and not self.data.empty
+    
     def get_latest_value(self) -> Optional[float]:
         """Get the most recent value"""
         if self.data is not None and not self.data.empty:
@@ -30,6 +38,18 @@ class EconomicData:
     
     def get_yoy_change(self) -> Optional[float]:
         """Get year-over-year change"""
+        return self.yoy_change
+    
+    def get_pct_change(self, periods: int = 12) -> float:
+        """Get fractional change over the last `periods` observations"""
+        if self.data is None or len(self.data) <= periods:
+            return np.nan
+        values = self.data.to_numpy()
+        return values[-1] / values[-1 - periods] - 1
+    
+    @cached_property
+    def yoy_change(self) -> Optional[float]:
+        """Year-over-year change, computed once per fetched series"""
         if self.data is not None and len(self.data) >= 12:
             try:
                 current = self.data.iloc[-1]
@@ -42,12 +62,31 @@ class EconomicData:
 class EconomicDataAgent:
     """Agent for collecting and processing economic data from FRED"""
     
+    # Fetched series shared across agents: (series_id, start, end) -> (fetch time, EconomicData)
+    _series_cache: Dict[tuple, tuple] = {}
+    
     def __init__(self):
         self.fred = Fred(api_key=EconomicConfig.FRED_API_KEY)
         
     def fetch_economic_data(self, series_id: str, start_date: str = None, 
                           end_date: str = None) -> EconomicData:
         """Fetch data for a specific FRED series"""
+        # FRED series update daily or slower, so reuse recent fetches of the same window
+        cache_key = (series_id, start_date, end_date)
+        cached = self._series_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < EconomicConfig.DATA_CACHE_TTL:
+            return cached[1]
+        
+        # Then reuse a fetch saved by an earlier run while it is still fresh
+        cache_path = self._disk_cache_path(cache_key)
+        if cache_path and cache_path.exists() and time.time() - cache_path.stat().st_mtime < EconomicConfig.DATA_CACHE_TTL:
+            try:
+                economic_data = self._series_from_json(cache_path.read_text(encoding='utf-8'))
+                self._remember_series(cache_key, economic_data)
+                return economic_data
+            except Exception as e:
+                print(f"Ignoring unreadable cache file {cache_path}: {str(e)}")
+        
         try:
             # Get series info
             info = self.fred.get_series_info(series_id)
@@ -59,7 +98,7 @@ class EconomicDataAgent:
                 end=end_date
             )
             
-            return EconomicData(
+            economic_data = EconomicData(
                 series_id=series_id,
                 series_name=info['title'],
                 data=data,
@@ -68,11 +107,62 @@ class EconomicDataAgent:
                 last_updated=info['last_updated'],
                 notes=info['notes']
             )
+            self._remember_series(cache_key, economic_data)
+            if cache_path:
+                self._write_disk_cache(cache_path, economic_data)
+            return economic_data
             
         except Exception as e:
             print(f"Error fetching data for {series_id}: {str(e)}")
             return None
     
+    def _disk_cache_path(self, cache_key: tuple) -> Optional[Path]:
+        """On-disk cache file for a fetched series, or None when the disk cache is disabled"""
+        if not EconomicConfig.DATA_CACHE_DIR:
+            return None
+        return Path(EconomicConfig.DATA_CACHE_DIR) / ("_".join(str(part) for part in cache_key) + ".json")
+    
+    @classmethod
+    def _remember_series(cls, cache_key: tuple, economic_data: EconomicData):
+        """Keep a fetched series in memory, dropping entries older than DATA_CACHE_TTL"""
+        # The end date moves with the clock, so stale windows would otherwise pile up in long sessions
+        now = time.monotonic()
+        for key, (fetched_at, _) in list(cls._series_cache.items()):
+            if now - fetched_at >= EconomicConfig.DATA_CACHE_TTL:
+                cls._series_cache.pop(key, None)
+        cls._series_cache[cache_key] = (now, economic_data)
+    
+    @staticmethod
+    def _series_to_json(economic_data: EconomicData) -> str:
+        """Serialize a series as plain JSON (date -> value) for the disk cache"""
+        return json.dumps({
+            "series_id": economic_data.series_id,
+            "series_name": economic_data.series_name,
+            "units": economic_data.units,
+            "frequency": economic_data.frequency,
+            "last_updated": economic_data.last_updated,
+            "notes": economic_data.notes,
+            "dates": economic_data.data.index.strftime('%Y-%m-%d').tolist(),
+            "values": economic_data.data.astype(float).tolist(),
+        }, default=str)
+    
+    @staticmethod
+    def _series_from_json(content: str) -> EconomicData:
+        """Rebuild a series saved by _series_to_json"""
+        fields = json.loads(content)
+        data = pd.Series(fields.pop("values"), index=pd.to_datetime(fields.pop("dates")), dtype=float)
+        return EconomicData(data=data, **fields)
+    
+    def _write_disk_cache(self, cache_path: Path, economic_data: EconomicData):
+        """Save a fetched series for later runs; written to a temp file first so readers never see a partial file"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = cache_path.with_name(f"{cache_path.name}.{uuid.uuid4().hex}.tmp")
+            temp_path.write_text(self._series_to_json(economic_data), encoding='utf-8')
+            os.replace(temp_path, cache_path)
+        except Exception as e:
+            print(f"Error caching data for {economic_data.series_id}: {str(e)}")
+    
     def fetch_gdp_indicators(self, period: str = "10y") -> Dict[str, EconomicData]:
         """Fetch GDP-related indicators"""
         end_date = datetime.now()
@@ -197,8 +287,12 @@ class EconomicDataAgent:
         return pd.DataFrame()
     
     def create_economic_dashboard_chart(self, gdp_data: Dict[str, EconomicData],
-                                      inflation_data: Dict[str, EconomicData]) -> go.Figure:
+                                      inflation_data: Dict[str, EconomicData]) -> "go.Figure":
         """Create a comprehensive economic dashboard"""
+        # Plotly is only needed for the dashboard, so keep it off the import path
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        
         fig = make_subplots(
             rows=2, cols=2,
             subplot_titles=('GDP Growth', 'Inflation Rate', 'GDP Level', 'Core CPI'),
@@ -0,0 +1,165 @@
+# Prompt templates for the economic analysis agent, filled with str.format_map
+
+class PromptFields(dict):
+    """Template fields that render as 'N/A' when a metric is missing"""
+
+    def __missing__(self, key):
+        return 'N/A'
+
+
+GDP_ANALYSIS_PROMPT = """
+Analyze the following GDP data and provide economic insights:
+
+Current GDP: ${current_gdp} billion
+GDP YoY Change: {gdp_yoy_change}%
+Current Growth Rate: {current_growth_rate}%
+Average Growth Rate: {average_growth_rate}%
+Growth Trend: {growth_trend}
+GDP per Capita: ${current_gdp_per_capita}
+GDP per Capita YoY: {gdp_per_capita_yoy}%
+
+Provide insights on:
+1. Overall economic health based on GDP metrics
+2. Growth trajectory and sustainability
+3. Productivity and living standards implications
+4. Key economic concerns or strengths
+"""
+
+INFLATION_ANALYSIS_PROMPT = """
+Analyze the following inflation data and provide economic insights:
+
+Current CPI: {current_cpi}
+CPI YoY Change: {cpi_yoy_change}%
+Current Core CPI: {current_core_cpi}
+Core CPI YoY Change: {core_cpi_yoy_change}%
+Current Inflation Rate: {current_inflation_rate}%
+Average Inflation Rate: {average_inflation_rate}%
+vs Fed Target (2%): {vs_fed_target}
+Current PCE: {current_pce}
+PCE YoY Change: {pce_yoy_change}%
+
+Provide insights on:
+1. Current inflationary pressures
+2. Core vs headline inflation dynamics
+3. Implications for monetary policy
+4. Consumer purchasing power impact
+5. Price stability outlook
+"""
+
+MARKET_ANALYSIS_PROMPT = """
+Analyze the following market trend data and provide economic insights:
+
+Current Unemployment Rate: {current_unemployment}%
+Unemployment Trend (YoY): {unemployment_trend}%
+Current Fed Funds Rate: {current_fed_rate}%
+Fed Rate Change (YoY): {fed_rate_change_yoy}%
+Current 10Y Treasury: {current_10y_treasury}%
+Treasury Change (YoY): {treasury_change_yoy}%
+Yield Spread: {yield_spread}%
+Yield Curve: {yield_curve}
+Consumer Confidence: {current_consumer_confidence}
+Confidence Change (YoY): {confidence_change_yoy}%
+Industrial Production Index: {current_industrial_production}
+Production Change (YoY): {production_change_yoy}%
+
+Provide insights on:
+1. Labor market health and employment trends
+2. Monetary policy stance and interest rate environment
+3. Credit conditions and financial stability
+4. Economic sentiment and business cycle position
+5. Manufacturing and industrial activity
+"""
+
+INDUSTRY_BATCH_PROMPT = """
+Analyze the following industry performance data:
+
+{industry_sections}
+
+For each industry provide insights on:
+1. Industry health and growth trajectory
+2. Employment trends and labor market dynamics
+3. Key economic drivers and challenges
+4. Competitive position and outlook
+5. Policy implications and regulatory environment
+
+Return a JSON object with one key per industry ({industries}),
+each holding that industry's analysis as plain text.
+"""
+
+ECONOMIC_INSIGHTS_PROMPT = """
+Based on the following economic data analysis, provide comprehensive economic insights:
+
+GDP ANALYSIS:
+{gdp_analysis}
+
+INFLATION ANALYSIS:
+{inflation_analysis}
+
+MARKET TRENDS ANALYSIS:
+{market_analysis}
+
+INDUSTRY ANALYSIS:
+{industry_analysis}
+
+Provide a comprehensive economic assessment including:
+1. Overall economic health assessment
+2. Key economic themes and patterns
+3. Cross-indicator relationships and correlations
+4. Economic cycle position and trajectory
+5. Major risks and opportunities
+6. Sector-specific insights and implications
+7. Economic outlook and key factors to monitor
+
+Format your response as clear, actionable insights.
+"""
+
+POLICY_IMPLICATIONS_PROMPT = """
+Based on the current economic conditions, analyze policy implications:
+
+CURRENT ECONOMIC STATE:
+- GDP Growth: {current_growth_rate}%
+- Inflation Rate: {current_inflation_rate}%
+- Unemployment: {current_unemployment}%
+- Fed Funds Rate: {current_fed_rate}%
+- Yield Curve: {yield_curve}
+
+ECONOMIC INSIGHTS:
+{economic_insights}
+
+Provide policy analysis covering:
+1. Monetary Policy Implications
+2. Fiscal Policy Considerations
+3. Regulatory Policy Recommendations
+4. Industry-Specific Policy Needs
+5. International Trade and Policy Coordination
+6. Risk Management and Contingency Planning
+
+Focus on actionable policy recommendations.
+"""
+
+FORECAST_PROMPT = """
+Based on comprehensive economic analysis, provide forward-looking forecasts:
+
+CURRENT ECONOMIC METRICS:
+- GDP Growth: {current_growth_rate}%
+- Inflation: {current_inflation_rate}%
+- Unemployment: {current_unemployment}%
+- Fed Funds Rate: {current_fed_rate}%
+- Consumer Confidence: {current_consumer_confidence}
+
+ECONOMIC TRENDS:
+{economic_insights}
+
+INDUSTRY PERFORMANCE:
+{industry_performance}
+
+Provide 6-month and 12-month forecasts for:
+1. GDP Growth Rate
+2. Inflation Rate
+3. Unemployment Rate
+4. Interest Rates (Fed Funds & 10Y Treasury)
+5. Industry Performance (Tech, Healthcare, Energy)
+6. Key Economic Risks and Opportunities
+
+Include confidence levels and key assumptions for each forecast.
+"""
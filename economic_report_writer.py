@@ -5,18 +5,23 @@ Generates comprehensive economic reports based on LangGraph Economic Agent resul
 
 import os
 import json
+import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Union
 from dataclasses import dataclass
+from pathlib import Path
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 from langchain_openai import ChatOpenAI
 from langchain.schema import HumanMessage, SystemMessage
 from economic_config import EconomicConfig
 from economic_data_agent import EconomicData
 
+# Serialize Plotly figures and prompt payloads with orjson when available (much faster on large traces)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 @dataclass
 class EconomicReportData:
     """Data structure for economic report generation"""
@@ -37,10 +42,27 @@ class EconomicReportWriter:
         EconomicConfig.validate()
         self.llm = ChatOpenAI(
             model=EconomicConfig.DEFAULT_MODEL,
-            temperature=0.2,  # Slightly higher for more creative report writing
+            temperature=EconomicConfig.model_temperature(0.2),  # Slightly higher for more creative report writing
             api_key=EconomicConfig.OPENAI_API_KEY
         )
         self.report_templates = self._load_report_templates()
+        self._system_msgs = self._load_system_messages()
+    
+    def _load_system_messages(self) -> Dict[str, SystemMessage]:
+        """Build the fixed system prompts once for reuse across LLM calls"""
+        return {
+            "executive_summary": SystemMessage(content="You are a senior economic analyst writing for C-suite executives and policymakers."),
+            "economic_overview": SystemMessage(content="You are an expert economic analyst writing a comprehensive economic overview."),
+            "risk_assessment": SystemMessage(content="You are a senior economic risk analyst providing comprehensive risk assessment."),
+            "industry_comparison": SystemMessage(content="You are an expert industry analyst providing detailed sector comparisons."),
+            "industry_trends": SystemMessage(content="You are an expert in industry trend analysis and market dynamics."),
+            "sector_outlook": SystemMessage(content="You are an expert in sector outlook and investment analysis."),
+            "macro_context": SystemMessage(content="You are an expert in macroeconomic analysis and sector performance."),
+            "investment_implications": SystemMessage(content="You are a senior investment strategist providing sector-based investment analysis."),
+            "policy_environment": SystemMessage(content="You are a policy economist analyzing the current policy environment."),
+            "implementation": SystemMessage(content="You are a policy implementation expert."),
+            "recommendations": SystemMessage(content="You are a senior economic strategist providing actionable recommendations."),
+        }
     
     def _load_report_templates(self) -> Dict[str, str]:
         """Load different report templates"""
@@ -247,7 +269,7 @@ class EconomicReportWriter:
         
         try:
             response = self.llm.invoke([
-                SystemMessage(content="You are a senior economic analyst writing for C-suite executives and policymakers."),
+                self._system_msgs["executive_summary"],
                 HumanMessage(content=summary_prompt)
             ])
             return response.content.strip()
@@ -283,7 +305,7 @@ class EconomicReportWriter:
         Based on the comprehensive economic analysis results, write a detailed economic overview section covering:
         
         ANALYSIS RESULTS:
-        {json.dumps(analysis_results, indent=2, default=str)[:2000]}...
+        {self._to_json(analysis_results)[:2000]}...
         
         The overview should cover:
         1. Current economic cycle position
@@ -297,7 +319,7 @@ class EconomicReportWriter:
         
         try:
             response = self.llm.invoke([
-                SystemMessage(content="You are an expert economic analyst writing a comprehensive economic overview."),
+                self._system_msgs["economic_overview"],
                 HumanMessage(content=overview_prompt)
             ])
             return response.content.strip()
@@ -435,7 +457,7 @@ class EconomicReportWriter:
         - Yield Curve: {analysis_results.get('market_analysis', {}).get('yield_curve', 'N/A')}
         
         INDUSTRY PERFORMANCE:
-        {json.dumps(analysis_results.get('industry_analysis', {}), indent=2, default=str)[:800]}
+        {self._to_json(analysis_results.get('industry_analysis', {}))[:800]}
         
         Provide a risk assessment covering:
         1. **Immediate Risks (0-6 months)**
@@ -448,7 +470,7 @@ class EconomicReportWriter:
         
         try:
             response = self.llm.invoke([
-                SystemMessage(content="You are a senior economic risk analyst providing comprehensive risk assessment."),
+                self._system_msgs["risk_assessment"],
                 HumanMessage(content=risk_prompt)
             ])
             return response.content.strip()
@@ -535,7 +557,7 @@ class EconomicReportWriter:
         comparison_prompt = f"""
         Analyze and compare the following industry performance data:
         
-        {json.dumps(industry_data, indent=2, default=str)}
+        {self._to_json(industry_data)}
         
         Focus on industries: {', '.join(focus_industries)}
         
@@ -549,7 +571,7 @@ class EconomicReportWriter:
         
         try:
             response = self.llm.invoke([
-                SystemMessage(content="You are an expert industry analyst providing detailed sector comparisons."),
+                self._system_msgs["industry_comparison"],
                 HumanMessage(content=comparison_prompt)
             ])
             return response.content.strip()
@@ -561,7 +583,7 @@ class EconomicReportWriter:
         trends_prompt = f"""
         Analyze industry trends based on the following data:
         
-        {json.dumps(industry_data, indent=2, default=str)}
+        {self._to_json(industry_data)}
         
         Focus on industries: {', '.join(focus_industries)}
         
@@ -575,7 +597,7 @@ class EconomicReportWriter:
         
         try:
             response = self.llm.invoke([
-                SystemMessage(content="You are an expert in industry trend analysis and market dynamics."),
+                self._system_msgs["industry_trends"],
                 HumanMessage(content=trends_prompt)
             ])
             return response.content.strip()
@@ -587,7 +609,7 @@ class EconomicReportWriter:
         outlook_prompt = f"""
         Provide sector outlook analysis based on:
         
-        {json.dumps(industry_data, indent=2, default=str)}
+        {self._to_json(industry_data)}
         
         Focus on industries: {', '.join(focus_industries)}
         
@@ -601,7 +623,7 @@ class EconomicReportWriter:
         
         try:
             response = self.llm.invoke([
-                SystemMessage(content="You are an expert in sector outlook and investment analysis."),
+                self._system_msgs["sector_outlook"],
                 HumanMessage(content=outlook_prompt)
             ])
             return response.content.strip()
@@ -623,7 +645,7 @@ class EconomicReportWriter:
         
         try:
             response = self.llm.invoke([
-                SystemMessage(content="You are an expert in macroeconomic analysis and sector performance."),
+                self._system_msgs["macro_context"],
                 HumanMessage(content=context_prompt)
             ])
             return response.content.strip()
@@ -672,7 +694,7 @@ class EconomicReportWriter:
         - Interest Rates: {analysis_results.get('market_analysis', {}).get('current_fed_rate', 'N/A')}%
         
         SECTOR DATA:
-        {json.dumps(analysis_results.get('industry_analysis', {}), indent=2, default=str)[:1000]}
+        {self._to_json(analysis_results.get('industry_analysis', {}))[:1000]}
         
         Provide investment implications covering:
         1. Sector attractiveness ranking
@@ -683,7 +705,7 @@ class EconomicReportWriter:
         
         try:
             response = self.llm.invoke([
-                SystemMessage(content="You are a senior investment strategist providing sector-based investment analysis."),
+                self._system_msgs["investment_implications"],
                 HumanMessage(content=investment_prompt)
             ])
             return response.content.strip()
@@ -742,7 +764,7 @@ The current economic environment shows {gdp.get('growth_trend', 'mixed')} growth
         
         try:
             response = self.llm.invoke([
-                SystemMessage(content="You are a policy economist analyzing the current policy environment."),
+                self._system_msgs["policy_environment"],
                 HumanMessage(content=policy_prompt)
             ])
             return response.content.strip()
@@ -768,7 +790,7 @@ The current economic environment shows {gdp.get('growth_trend', 'mixed')} growth
         
         try:
             response = self.llm.invoke([
-                SystemMessage(content="You are a policy implementation expert."),
+                self._system_msgs["implementation"],
                 HumanMessage(content=impl_prompt)
             ])
             return response.content.strip()
@@ -828,7 +850,7 @@ The current economic environment shows {gdp.get('growth_trend', 'mixed')} growth
         
         try:
             response = self.llm.invoke([
-                SystemMessage(content="You are a senior economic strategist providing actionable recommendations."),
+                self._system_msgs["recommendations"],
                 HumanMessage(content=rec_prompt)
             ])
             
@@ -949,6 +971,13 @@ The current economic environment shows {gdp.get('growth_trend', 'mixed')} growth
         
         return formatted_report
     
+    def _to_json(self, data: Any) -> str:
+        """Serialize analysis results as indented JSON for report prompts"""
+        if orjson is not None:
+            return orjson.dumps(data, default=str,
+                                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+        return json.dumps(data, indent=2, default=str)
+    
     def _format_key_indicators(self, analysis_results: Dict[str, Any]) -> str:
         """Format key indicators summary"""
         gdp = analysis_results.get("gdp_analysis", {})
@@ -981,12 +1010,14 @@ The current economic environment shows {gdp.get('growth_trend', 'mixed')} growth
     def _save_report(self, report_content: str, report_type: str) -> str:
         """Save the generated report to file"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{EconomicConfig.REPORT_OUTPUT_DIR}/economic_{report_type}_report_{timestamp}.txt"
+        filename = Path(EconomicConfig.REPORT_OUTPUT_DIR) / f"economic_{report_type}_report_{timestamp}.txt"
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(report_content)
-            return filename
+            # Write to a temp file and rename so readers never see a partial report
+            temp_filename = filename.with_name(f"{filename.name}.{uuid.uuid4().hex}.tmp")
+            temp_filename.write_text(report_content, encoding='utf-8')
+            os.replace(temp_filename, filename)
+            return str(filename)
         except Exception as e:
             print(f"Error saving report: {str(e)}")
             return f"Error saving report: {str(e)}"
@@ -1010,6 +1041,13 @@ The current economic environment shows {gdp.get('growth_trend', 'mixed')} growth
     def create_executive_dashboard(self, analysis_results: Dict[str, Any]) -> str:
         """Create a professional executive dashboard visualization"""
         try:
+            # Plotly is only needed for the dashboard, so keep it off the report-writing import path
+            import plotly.graph_objects as go
+            import plotly.io as pio
+            from plotly.subplots import make_subplots
+            if orjson is not None:
+                pio.json.config.default_engine = "orjson"
+            
             # Extract key metrics
             gdp_growth = analysis_results.get("gdp_analysis", {}).get("current_growth_rate", 0)
             inflation_rate = analysis_results.get("inflation_analysis", {}).get("current_inflation_rate", 0)
@@ -1120,8 +1158,9 @@ The current economic environment shows {gdp.get('growth_trend', 'mixed')} growth
             
             # Save dashboard
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            dashboard_path = f"{EconomicConfig.CHART_OUTPUT_DIR}/executive_dashboard_{timestamp}.png"
-            fig.write_image(dashboard_path, width=1400, height=1000, scale=2)
+            dashboard_path = str(Path(EconomicConfig.CHART_OUTPUT_DIR) / f"executive_dashboard_{timestamp}.png")
+            png_bytes = fig.to_image(format="png", width=1400, height=1000, scale=2)
+            Path(dashboard_path).write_bytes(png_bytes)
             
             return dashboard_path
             
@@ -1,26 +1,92 @@
-from typing import TypedDict, List, Dict, Any, Annotated
+import asyncio
+import atexit
+import functools
+from typing import TypedDict, List, Dict, Any, Annotated, Callable, Optional
 from langgraph.graph import StateGraph, END
+from langgraph.types import Send
 #from langgraph.prebuilt import ToolExecutor
 #from langgraph.prebuilt.tool_executor import ToolExecutor
 from langchain_openai import ChatOpenAI
-from langchain.tools import tool
-from langchain.schema import HumanMessage, SystemMessage
+from langchain.schema import AIMessage, HumanMessage, SystemMessage
+from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+import hashlib
 import operator
-from economic_data_agent import EconomicDataAgent, EconomicData
+import os
+import re
+import uuid
+import sqlite3
+import time
+from contextlib import closing
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from economic_data_agent import EconomicDataAgent
 from economic_config import EconomicConfig
+from economic_prompts import (
+    PromptFields, GDP_ANALYSIS_PROMPT, INFLATION_ANALYSIS_PROMPT, MARKET_ANALYSIS_PROMPT,
+    INDUSTRY_BATCH_PROMPT, ECONOMIC_INSIGHTS_PROMPT, POLICY_IMPLICATIONS_PROMPT, FORECAST_PROMPT
+)
 import json
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import matplotlib.style
+from matplotlib.figure import Figure
+from matplotlib.ticker import FuncFormatter
 import numpy as np
 from datetime import datetime
+from pathlib import Path
+
+# orjson is faster for prompt serialization; fall back to stdlib json without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Matplotlib is not thread-safe and the chart style is applied through global rcParams,
+# so concurrent runs render their charts one at a time
+_CHART_LOCK = threading.Lock()
+
+@functools.cache
+def _start_kaleido_server() -> None:
+    """Keep one Kaleido browser running for every Plotly image export in this process"""
+    try:
+        import kaleido
+        kaleido.start_sync_server(silence_warnings=True)
+    except (ImportError, AttributeError):
+        return  # Kaleido < 1.1 has no persistent server; exports fall back to one browser each
+    atexit.register(kaleido.stop_sync_server, silence_warnings=True)
+
+def _pairwise_corr(values: np.ndarray) -> np.ndarray:
+    """Pearson correlation of columns over pairwise-complete rows, matching DataFrame.corr()"""
+    # Mixed-frequency series leave NaNs, so each pair only uses the rows where both are present.
+    # Columns are centered first so the sum-of-products form stays accurate for large levels like GDP.
+    present = ~np.isnan(values)
+    mask = present.astype(np.float64)
+    centered = np.where(present, values - np.nanmean(values, axis=0), 0.0)
+    n = mask.T @ mask
+    sum_x = centered.T @ mask
+    sum_xx = (centered * centered).T @ mask
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = centered.T @ centered - sum_x * sum_x.T / n
+        var_x = sum_xx - sum_x * sum_x / n
+        corr = cov / np.sqrt(var_x * var_x.T)
+    corr[n < 2] = np.nan
+    return np.clip(corr, -1.0, 1.0)
+
+def _render_chart(builder: Callable, data: Any, chart_path: str) -> Optional[str]:
+    """Build a matplotlib chart and save it to chart_path"""
+    # Figures are built without pyplot, so the caller's backend and open figures are untouched
+    with _CHART_LOCK, matplotlib.style.context('seaborn-v0_8-whitegrid'):
+        fig = builder(data)
+        if fig is None:
+            return None
+        fig.savefig(chart_path, dpi=300, bbox_inches='tight', facecolor='white')
+    return chart_path
 
 class EconomicAnalysisState(TypedDict):
     """State for the economic analysis workflow"""
     analysis_type: str  # 'gdp', 'inflation', 'market_trends', 'industry', 'comprehensive'
     period: str
     focus_industries: List[str]
-    raw_data: Dict[str, Any]
+    raw_data_id: str  # key into the agent's raw data store; pandas series stay out of state
     gdp_analysis: Dict[str, Any]
     inflation_analysis: Dict[str, Any]
     market_analysis: Dict[str, Any]
@@ -30,20 +96,118 @@ class EconomicAnalysisState(TypedDict):
     forecasts: Dict[str, Any]
     messages: Annotated[List, operator.add]
     chart_paths: List[str]
-    error_messages: List[str]
+    error_messages: Annotated[List[str], operator.add]
 
 class LangGraphEconomicAgent:
     """LangGraph-based economic analysis agent"""
     
+    # Analysis node fed by each raw_data category; these run in parallel
+    ANALYSIS_NODES = {
+        "gdp": "analyze_gdp",
+        "inflation": "analyze_inflation",
+        "market": "analyze_market_trends",
+        "industry": "analyze_industry_performance",
+    }
+    
+    # raw_data categories collected for each analysis type
+    ANALYSIS_CATEGORIES = {
+        "comprehensive": ("gdp", "inflation", "market", "industry"),
+        "gdp": ("gdp",),
+        "inflation": ("inflation",),
+        "market_trends": ("market",),
+        "industry": ("industry",),
+    }
+    
+    # EconomicDataAgent fetch method and message label per raw_data category
+    DATA_FETCHERS = {
+        "gdp": ("fetch_gdp_indicators", "GDP"),
+        "inflation": ("fetch_inflation_indicators", "inflation"),
+        "market": ("fetch_market_trends", "market"),
+        "industry": ("fetch_industry_performance", "industry"),
+    }
+    
+    # Metrics reported per industry: series key -> (level field, YoY change field)
+    INDUSTRY_METRICS = {
+        "tech": {
+            "tech_employment": ("employment", "employment_change_yoy"),
+            "tech_wages": ("wages", "wage_change_yoy"),
+        },
+        "healthcare": {
+            "healthcare_employment": ("employment", "employment_change_yoy"),
+            "healthcare_cpi": ("healthcare_cpi", "healthcare_cpi_change_yoy"),
+        },
+        "energy": {
+            "energy_employment": ("employment", "employment_change_yoy"),
+            "oil_price": ("oil_price", "oil_price_change_yoy"),
+            "natural_gas": ("natural_gas_price", "natural_gas_change_yoy"),
+        },
+    }
+    
+    # Industry comparison chart: industries, labels, and bar colors for employment and wages
+    CHART_INDUSTRIES = ("tech", "healthcare", "energy")
+    CHART_INDUSTRY_LABELS = ("Technology", "Healthcare", "Energy")
+    CHART_INDUSTRY_COLORS = ('#2E86AB', '#A23B72', '#F18F01')  # Professional color palette
+    CHART_WAGE_COLORS = ('#2E8672', '#C76B98', '#F18F72')  # Distinct from each employment color
+    
+    # Upper bound on industries packed into one batched LLM request
+    INDUSTRY_BATCH_SIZE = 6
+    
+    # Nodes whose LLM output is passed to on_token while it streams
+    STREAMED_NODES = frozenset({"generate_economic_insights", "policy_implications", "generate_forecasts"})
+    
+    # OpenAI errors worth retrying with exponential backoff
+    RETRYABLE_LLM_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+    
+    # Non-blank line of LLM output, captured without surrounding whitespace
+    LINE_PATTERN = re.compile(r"^[^\S\n]*(\S.*?)[^\S\n]*$", re.MULTILINE)
+    
+    # Bullet or numbered line in LLM output, e.g. "- text", "• text", "2. text"
+    KEY_POINT_PATTERN = re.compile(r"^(?:[-*•]|\d+[.)])\s+(.+)")
+    
+    # Outermost JSON object in LLM output, ignoring code fences or prose around it
+    JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+    # Parts of an industry key that models add or vary: case, separators, "industry"/"sector"
+    INDUSTRY_KEY_NOISE = re.compile(r"[\W_]+|industry|sector")
+    
+    # Model name prefixes that accept response_format={"type": "json_object"}; base gpt-4 does not
+    JSON_MODE_MODEL_PREFIXES = ("gpt-4o", "gpt-4.1", "gpt-4-turbo", "gpt-4-1106", "gpt-4-0125",
+                                "gpt-3.5-turbo-1106", "gpt-3.5-turbo-0125", "gpt-5", "o3", "o4")
+    
+    # Model name prefixes that accept service_tier="flex"; other models reject the request
+    FLEX_TIER_MODEL_PREFIXES = ("o3", "o4-mini", "gpt-5")
+    # Flex requests can queue for minutes, well past the client's default timeout
+    FLEX_REQUEST_TIMEOUT = 900
+    
     def __init__(self):
         EconomicConfig.validate()
+        service_tier = EconomicConfig.OPENAI_SERVICE_TIER
+        if service_tier == "flex" and not EconomicConfig.DEFAULT_MODEL.startswith(self.FLEX_TIER_MODEL_PREFIXES):
+            print(f"⚠️ Flex service tier is not available for {EconomicConfig.DEFAULT_MODEL}, using the default tier")
+            service_tier = None
         self.llm = ChatOpenAI(
             model=EconomicConfig.DEFAULT_MODEL,
-            temperature=0.1,
-            api_key=EconomicConfig.OPENAI_API_KEY
+            temperature=EconomicConfig.model_temperature(0.1),
+            api_key=EconomicConfig.OPENAI_API_KEY,
+            service_tier=service_tier,
+            timeout=self.FLEX_REQUEST_TIMEOUT if service_tier == "flex" else None,
+            max_retries=0  # _ainvoke_llm retries; client retries would multiply its attempts
         )
         self.economic_agent = EconomicDataAgent()
+        # System prompts are fixed, so build the messages once and reuse them
+        self._system_msgs = {
+            "gdp": SystemMessage(content="You are an expert economic analyst."),
+            "inflation": SystemMessage(content="You are an expert economic analyst specializing in inflation."),
+            "market": SystemMessage(content="You are an expert economic analyst specializing in market trends."),
+            "industry": SystemMessage(content="You are an expert economic analyst specializing in industry analysis."),
+            "insights": SystemMessage(content="You are a senior economic strategist providing comprehensive economic analysis."),
+            "policy": SystemMessage(content="You are an expert policy economist advising on macroeconomic policy."),
+            "forecasts": SystemMessage(content="You are an expert economic forecaster with deep knowledge of economic cycles and trends."),
+        }
+        # Fetched EconomicData per run, kept out of graph state so checkpoints stay small
+        self._raw_data: Dict[str, Dict[str, Any]] = {}
         self._graph = None
+        self._llm_semaphore = None
+        self._llm_semaphore_loop = None
     
     @property
     def graph(self):
@@ -52,12 +216,76 @@ class LangGraphEconomicAgent:
             self._graph = self._create_workflow()
         return self._graph
     
+    def _get_llm_semaphore(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent LLM calls on the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._llm_semaphore_loop is not loop:
+            self._llm_semaphore = asyncio.Semaphore(EconomicConfig.LLM_MAX_CONCURRENCY)
+            self._llm_semaphore_loop = loop
+        return self._llm_semaphore
+    
+    def _llm_cache_key(self, messages: List, bind_kwargs: Dict[str, Any]) -> str:
+        """Hash the model, call options and prompt into an LLM cache key"""
+        payload = json.dumps([EconomicConfig.DEFAULT_MODEL, bind_kwargs,
+                              [(message.type, message.content) for message in messages]],
+                             sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    
+    def _read_llm_cache(self, key: str) -> Optional[str]:
+        """Return a cached LLM response for the key if it is younger than LLM_CACHE_TTL"""
+        if not EconomicConfig.LLM_CACHE_PATH or not Path(EconomicConfig.LLM_CACHE_PATH).exists():
+            return None
+        try:
+            with closing(sqlite3.connect(EconomicConfig.LLM_CACHE_PATH)) as conn:
+                row = conn.execute("SELECT content FROM llm_responses WHERE key = ? AND created_at >= ?",
+                                   (key, time.time() - EconomicConfig.LLM_CACHE_TTL)).fetchone()
+        except sqlite3.OperationalError:
+            return None  # nothing has been cached in this file yet
+        except Exception as e:
+            print(f"⚠️ LLM cache read failed: {str(e)}")
+            return None
+        return row[0] if row else None
+    
+    def _write_llm_cache(self, key: str, content: str):
+        """Store an LLM response under the key, dropping expired responses"""
+        if not EconomicConfig.LLM_CACHE_PATH:
+            return
+        try:
+            Path(EconomicConfig.LLM_CACHE_PATH).parent.mkdir(parents=True, exist_ok=True)
+            now = time.time()
+            with closing(sqlite3.connect(EconomicConfig.LLM_CACHE_PATH)) as conn, conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS llm_responses "
+                             "(key TEXT PRIMARY KEY, content TEXT, created_at REAL)")
+                conn.execute("DELETE FROM llm_responses WHERE created_at < ?", (now - EconomicConfig.LLM_CACHE_TTL,))
+                conn.execute("INSERT OR REPLACE INTO llm_responses VALUES (?, ?, ?)", (key, content, now))
+        except Exception as e:
+            # A cache failure must not turn a good response into a node error
+            print(f"⚠️ LLM cache write failed: {str(e)}")
+    
+    async def _ainvoke_llm(self, messages: List, **bind_kwargs):
+        """Invoke the LLM under the concurrency limit, retrying rate-limit and transient errors"""
+        # Identical prompts reuse the earlier response until LLM_CACHE_TTL expires; sqlite runs
+        # on a worker thread so it doesn't block the other analysis branches on the event loop
+        cache_key = self._llm_cache_key(messages, bind_kwargs)
+        cached = await asyncio.to_thread(self._read_llm_cache, cache_key)
+        if cached is not None:
+            return AIMessage(content=cached)
+        
+        llm = self.llm.bind(**bind_kwargs) if bind_kwargs else self.llm
+        llm = llm.with_retry(retry_if_exception_type=self.RETRYABLE_LLM_ERRORS,
+                             stop_after_attempt=EconomicConfig.LLM_MAX_RETRIES)
+        async with self._get_llm_semaphore():
+            response = await llm.ainvoke(messages)
+        await asyncio.to_thread(self._write_llm_cache, cache_key, response.content)
+        return response
+    
     def _create_workflow(self):
         """Create the LangGraph workflow for economic analysis"""
         workflow = StateGraph(EconomicAnalysisState)
         
         # Add nodes
         workflow.add_node("collect_economic_data", self._collect_economic_data)
+        # Analyzers and charts report failures as results, so they are not node-cached; the LLM cache replays prompts
         workflow.add_node("analyze_gdp", self._analyze_gdp)
         workflow.add_node("analyze_inflation", self._analyze_inflation)
         workflow.add_node("analyze_market_trends", self._analyze_market_trends)
@@ -68,120 +296,104 @@ class LangGraphEconomicAgent:
         workflow.add_node("generate_forecasts", self._generate_forecasts)
         workflow.add_node("final_report", self._generate_final_report)
         
-        # Define the workflow with conditional routing based on analysis type
-        workflow.set_entry_point("collect_economic_data")
-        
         # Always collect data first
-        workflow.add_edge("collect_economic_data", "analyze_gdp")
-        
-        # Conditional routing based on analysis type
-        workflow.add_conditional_edges(
-            "analyze_gdp",
-            self._should_continue_to_inflation,
-            {
-                "inflation": "analyze_inflation",
-                "skip": "generate_economic_insights"
-            }
-        )
-        
-        workflow.add_conditional_edges(
-            "analyze_inflation",
-            self._should_continue_to_market,
-            {
-                "market": "analyze_market_trends",
-                "skip": "generate_economic_insights"
-            }
-        )
+        workflow.set_entry_point("collect_economic_data")
         
+        # Fan out to every analysis node that has data, then fan back in at insights;
+        # charts only need raw data, so they render alongside the analyses.
+        # Stop early if data collection failed
         workflow.add_conditional_edges(
-            "analyze_market_trends",
-            self._should_continue_to_industry,
-            {
-                "industry": "analyze_industry_performance",
-                "skip": "generate_economic_insights"
-            }
+            "collect_economic_data",
+            self._dispatch_analyses,
+            list(self.ANALYSIS_NODES.values()) + ["generate_economic_insights", "create_visualizations", END]
         )
+        for node in self.ANALYSIS_NODES.values():
+            workflow.add_edge(node, "generate_economic_insights")
         
-        # Continue with remaining steps
-        workflow.add_edge("analyze_industry_performance", "generate_economic_insights")
-        workflow.add_edge("generate_economic_insights", "create_visualizations")
-        workflow.add_edge("create_visualizations", "policy_implications")
-        workflow.add_edge("policy_implications", "generate_forecasts")
-        workflow.add_edge("generate_forecasts", "final_report")
+        # Policy and forecasts both build on the insights alone, so they run side by side;
+        # the report waits for them and the charts
+        workflow.add_edge("generate_economic_insights", "policy_implications")
+        workflow.add_edge("generate_economic_insights", "generate_forecasts")
+        workflow.add_edge(["policy_implications", "generate_forecasts", "create_visualizations"], "final_report")
         workflow.add_edge("final_report", END)
         
         return workflow.compile()
     
-    def _should_continue_to_inflation(self, state: EconomicAnalysisState) -> str:
-        """Determine if analysis should continue to inflation based on analysis type"""
-        analysis_type = state.get("analysis_type", "comprehensive")
-        if analysis_type in ["comprehensive", "inflation", "market_trends", "industry"]:
-            return "inflation"
-        return "skip"
-    
-    def _should_continue_to_market(self, state: EconomicAnalysisState) -> str:
-        """Determine if analysis should continue to market trends based on analysis type"""
-        analysis_type = state.get("analysis_type", "comprehensive")
-        if analysis_type in ["comprehensive", "market_trends", "industry"]:
-            return "market"
-        return "skip"
-    
-    def _should_continue_to_industry(self, state: EconomicAnalysisState) -> str:
-        """Determine if analysis should continue to industry analysis based on analysis type"""
-        analysis_type = state.get("analysis_type", "comprehensive")
-        if analysis_type in ["comprehensive", "industry"]:
-            return "industry"
-        return "skip"
+    def _dispatch_analyses(self, state: EconomicAnalysisState):
+        """Send the state to each analysis node whose data was collected, plus chart rendering"""
+        # Nothing downstream is useful if collection failed; skip the LLM calls
+        if state.get("error_messages"):
+            return END
+        
+        raw_data = self._get_raw_data(state)
+        sends = [Send(node, state) for category, node in self.ANALYSIS_NODES.items()
+                 if self._has_series(raw_data.get(category, {}))]
+        if not sends:
+            sends.append(Send("generate_economic_insights", state))
+        sends.append(Send("create_visualizations", state))
+        return sends
     
-    def _collect_economic_data(self, state: EconomicAnalysisState) -> EconomicAnalysisState:
+    def _collect_economic_data(self, state: EconomicAnalysisState) -> Dict[str, Any]:
         """Collect economic data from FRED based on analysis type"""
+        raw_data = {}
+        messages = []
         try:
             period = state.get("period", EconomicConfig.DEFAULT_PERIOD)
             analysis_type = state.get("analysis_type", "comprehensive")
             
-            # Initialize raw_data
-            state["raw_data"] = {}
-            
-            # Collect data based on analysis type
-            if analysis_type in ["comprehensive", "gdp"]:
-                gdp_data = self.economic_agent.fetch_gdp_indicators(period)
-                state["raw_data"]["gdp"] = gdp_data
-                state["messages"].append(f"✅ Collected GDP data for {period}")
-            
-            if analysis_type in ["comprehensive", "inflation"]:
-                inflation_data = self.economic_agent.fetch_inflation_indicators(period)
-                state["raw_data"]["inflation"] = inflation_data
-                state["messages"].append(f"✅ Collected inflation data for {period}")
-            
-            if analysis_type in ["comprehensive", "market_trends"]:
-                market_data = self.economic_agent.fetch_market_trends(period)
-                state["raw_data"]["market"] = market_data
-                state["messages"].append(f"✅ Collected market data for {period}")
+            # Collect data based on analysis type; FRED calls are I/O-bound, so fetch categories concurrently
+            categories = self.ANALYSIS_CATEGORIES.get(analysis_type, ())
+            with ThreadPoolExecutor(max_workers=max(len(categories), 1)) as executor:
+                futures = {category: executor.submit(getattr(self.economic_agent, self.DATA_FETCHERS[category][0]), period)
+                           for category in categories}
+                for category, future in futures.items():
+                    raw_data[category] = future.result()
+                    if self._has_series(raw_data[category]):
+                        messages.append(f"✅ Collected {self.DATA_FETCHERS[category][1]} data for {period}")
+                    else:
+                        messages.append(f"⚠️ No {self.DATA_FETCHERS[category][1]} data returned for {period}")
             
-            if analysis_type in ["comprehensive", "industry"]:
-                industry_data = self.economic_agent.fetch_industry_performance(period)
-                state["raw_data"]["industry"] = industry_data
-                state["messages"].append(f"✅ Collected industry data for {period}")
+            # Fetchers log FRED errors and return empty data, so check that something actually came back
+            if categories and not self._has_series(raw_data):
+                error_msg = f"No economic data series could be fetched for {analysis_type} analysis"
+                return {"messages": messages + [f"❌ {error_msg}"], "error_messages": [error_msg]}
             
-            state["messages"].append(f"✅ Successfully collected economic data for {analysis_type} analysis")
+            messages.append(f"✅ Successfully collected economic data for {analysis_type} analysis")
+            raw_data_id = uuid.uuid4().hex
+            self._raw_data[raw_data_id] = raw_data
+            return {"raw_data_id": raw_data_id, "messages": messages}
             
         except Exception as e:
+            # The run ends here, so the partial data is not stored
             error_msg = f"Error collecting economic data: {str(e)}"
-            if "error_messages" not in state:
-                state["error_messages"] = []
-                state["error_messages"].append(error_msg)
-                state["messages"].append(f"❌ {error_msg}")
-        
-        return state
+            return {"messages": messages + [f"❌ {error_msg}"], "error_messages": [error_msg]}
+    
+    @classmethod
+    def _has_series(cls, data: Dict[str, Any]) -> bool:
+        """Whether the collected data holds at least one fetched series, at any nesting level"""
+        return any(cls._has_series(value) if isinstance(value, dict) else value is not None
+                   for value in data.values())
     
-    def _analyze_gdp(self, state: EconomicAnalysisState) -> EconomicAnalysisState:
+    def _get_raw_data(self, state: EconomicAnalysisState) -> Dict[str, Any]:
+        """Look up the data collected for this run"""
+        return self._raw_data.get(state.get("raw_data_id", ""), {})
+    
+    def _run_file_tag(self, state: EconomicAnalysisState, now: datetime) -> str:
+        """Filename tag unique to this run: analysis type, period, timestamp and run id"""
+        # Concurrent runs can share type, period and second, so the run id keeps their files apart
+        run_id = state.get("raw_data_id") or uuid.uuid4().hex
+        return "_".join([state.get("analysis_type", "comprehensive"),
+                         state.get("period", EconomicConfig.DEFAULT_PERIOD),
+                         now.strftime('%Y%m%d_%H%M%S'), run_id[:8]])
+    
+    async def _analyze_gdp(self, state: EconomicAnalysisState) -> Dict[str, Any]:
         """Analyze GDP indicators"""
         try:
-            if "gdp" not in state["raw_data"]:
-                state["messages"].append("⚠️ No GDP data available for analysis")
-                return state
+            raw_data = self._get_raw_data(state)
+            if "gdp" not in raw_data:
+                return {"messages": ["⚠️ No GDP data available for analysis"]}
                 
-            gdp_data = state["raw_data"]["gdp"]
+            gdp_data = raw_data["gdp"]
             
             analysis = {}
             
@@ -210,49 +422,31 @@ class LangGraphEconomicAgent:
                 analysis["current_gdp_per_capita"] = current_per_capita
                 analysis["gdp_per_capita_yoy"] = per_capita_yoy
             
+            # Skip the LLM call when none of the indicators were fetched
+            if not analysis:
+                return {"messages": ["⚠️ No GDP indicators available for analysis"]}
+            
             # AI-powered GDP analysis
-            gdp_prompt = f"""
-            Analyze the following GDP data and provide economic insights:
-            
-            Current GDP: ${analysis.get('current_gdp', 'N/A')} billion
-            GDP YoY Change: {analysis.get('gdp_yoy_change', 'N/A')}%
-            Current Growth Rate: {analysis.get('current_growth_rate', 'N/A')}%
-            Average Growth Rate: {analysis.get('average_growth_rate', 'N/A')}%
-            Growth Trend: {analysis.get('growth_trend', 'N/A')}
-            GDP per Capita: ${analysis.get('current_gdp_per_capita', 'N/A')}
-            GDP per Capita YoY: {analysis.get('gdp_per_capita_yoy', 'N/A')}%
-            
-            Provide insights on:
-            1. Overall economic health based on GDP metrics
-            2. Growth trajectory and sustainability
-            3. Productivity and living standards implications
-            4. Key economic concerns or strengths
-            """
-            
-            response = self.llm.invoke([SystemMessage(content="You are an expert economic analyst."), 
+            gdp_prompt = GDP_ANALYSIS_PROMPT.format_map(PromptFields(analysis))
+            
+            response = await self._ainvoke_llm([self._system_msgs["gdp"], 
                                       HumanMessage(content=gdp_prompt)])
             analysis["ai_insights"] = response.content
             
-            state["gdp_analysis"] = analysis
-            state["messages"].append("✅ GDP analysis completed")
+            return {"gdp_analysis": analysis, "messages": ["✅ GDP analysis completed"]}
             
         except Exception as e:
             error_msg = f"Error in GDP analysis: {str(e)}"
-            if "error_messages" not in state:
-                state["error_messages"] = []
-            state["error_messages"].append(error_msg)
-            state["messages"].append(f"❌ {error_msg}")
-        
-        return state
+            return {"error_messages": [error_msg], "messages": [f"❌ {error_msg}"]}
     
-    def _analyze_inflation(self, state: EconomicAnalysisState) -> EconomicAnalysisState:
+    async def _analyze_inflation(self, state: EconomicAnalysisState) -> Dict[str, Any]:
         """Analyze inflation indicators"""
         try:
-            if "inflation" not in state["raw_data"]:
-                state["messages"].append("⚠️ No inflation data available for analysis")
-                return state
+            raw_data = self._get_raw_data(state)
+            if "inflation" not in raw_data:
+                return {"messages": ["⚠️ No inflation data available for analysis"]}
                 
-            inflation_data = state["raw_data"]["inflation"]
+            inflation_data = raw_data["inflation"]
             
             analysis = {}
             
@@ -291,59 +485,38 @@ class LangGraphEconomicAgent:
                 analysis["current_pce"] = current_pce
                 analysis["pce_yoy_change"] = pce_yoy
             
+            # Skip the LLM call when none of the indicators were fetched
+            if not analysis:
+                return {"messages": ["⚠️ No inflation indicators available for analysis"]}
+            
             # AI-powered inflation analysis
-            inflation_prompt = f"""
-            Analyze the following inflation data and provide economic insights:
-            
-            Current CPI: {analysis.get('current_cpi', 'N/A')}
-            CPI YoY Change: {analysis.get('cpi_yoy_change', 'N/A')}%
-            Current Core CPI: {analysis.get('current_core_cpi', 'N/A')}
-            Core CPI YoY Change: {analysis.get('core_cpi_yoy_change', 'N/A')}%
-            Current Inflation Rate: {analysis.get('current_inflation_rate', 'N/A')}%
-            Average Inflation Rate: {analysis.get('average_inflation_rate', 'N/A')}%
-            vs Fed Target (2%): {analysis.get('vs_fed_target', 'N/A')}
-            Current PCE: {analysis.get('current_pce', 'N/A')}
-            PCE YoY Change: {analysis.get('pce_yoy_change', 'N/A')}%
-            
-            Provide insights on:
-            1. Current inflationary pressures
-            2. Core vs headline inflation dynamics
-            3. Implications for monetary policy
-            4. Consumer purchasing power impact
-            5. Price stability outlook
-            """
-            
-            response = self.llm.invoke([SystemMessage(content="You are an expert economic analyst specializing in inflation."), 
+            inflation_prompt = INFLATION_ANALYSIS_PROMPT.format_map(PromptFields(analysis))
+            
+            response = await self._ainvoke_llm([self._system_msgs["inflation"], 
                                       HumanMessage(content=inflation_prompt)])
             analysis["ai_insights"] = response.content
             
-            state["inflation_analysis"] = analysis
-            state["messages"].append("✅ Inflation analysis completed")
+            return {"inflation_analysis": analysis, "messages": ["✅ Inflation analysis completed"]}
             
         except Exception as e:
             error_msg = f"Error in inflation analysis: {str(e)}"
-            if "error_messages" not in state:
-                state["error_messages"] = []
-            state["error_messages"].append(error_msg)
-            state["messages"].append(f"❌ {error_msg}")
-        
-        return state
+            return {"error_messages": [error_msg], "messages": [f"❌ {error_msg}"]}
     
-    def _analyze_market_trends(self, state: EconomicAnalysisState) -> EconomicAnalysisState:
+    async def _analyze_market_trends(self, state: EconomicAnalysisState) -> Dict[str, Any]:
         """Analyze market trend indicators"""
         try:
-            if "market" not in state["raw_data"]:
-                state["messages"].append("⚠️ No market data available for analysis")
-                return state
+            raw_data = self._get_raw_data(state)
+            if "market" not in raw_data:
+                return {"messages": ["⚠️ No market data available for analysis"]}
                 
-            market_data = state["raw_data"]["market"]
+            market_data = raw_data["market"]
             
             analysis = {}
             
             # Unemployment analysis
             if "unemployment" in market_data and market_data["unemployment"]:
                 current_unemployment = market_data["unemployment"].get_latest_value()
-                unemployment_trend = market_data["unemployment"].data.pct_change(periods=12).iloc[-1]
+                unemployment_trend = market_data["unemployment"].get_pct_change(12)
                 
                 analysis["current_unemployment"] = current_unemployment
                 analysis["unemployment_trend"] = unemployment_trend
@@ -351,14 +524,14 @@ class LangGraphEconomicAgent:
             # Interest rates analysis
             if "fed_funds" in market_data and market_data["fed_funds"]:
                 current_fed_rate = market_data["fed_funds"].get_latest_value()
-                fed_rate_change = market_data["fed_funds"].data.pct_change(periods=12).iloc[-1]
+                fed_rate_change = market_data["fed_funds"].get_pct_change(12)
                 
                 analysis["current_fed_rate"] = current_fed_rate
                 analysis["fed_rate_change_yoy"] = fed_rate_change
             
             if "10y_treasury" in market_data and market_data["10y_treasury"]:
                 current_10y = market_data["10y_treasury"].get_latest_value()
-                treasury_change = market_data["10y_treasury"].data.pct_change(periods=12).iloc[-1]
+                treasury_change = market_data["10y_treasury"].get_pct_change(12)
                 
                 analysis["current_10y_treasury"] = current_10y
                 analysis["treasury_change_yoy"] = treasury_change
@@ -385,55 +558,31 @@ class LangGraphEconomicAgent:
                 analysis["current_industrial_production"] = current_production
                 analysis["production_change_yoy"] = production_change
             
+            # Skip the LLM call when none of the indicators were fetched
+            if not analysis:
+                return {"messages": ["⚠️ No market indicators available for analysis"]}
+            
             # AI-powered market trends analysis
-            market_prompt = f"""
-            Analyze the following market trend data and provide economic insights:
-            
-            Current Unemployment Rate: {analysis.get('current_unemployment', 'N/A')}%
-            Unemployment Trend (YoY): {analysis.get('unemployment_trend', 'N/A')}%
-            Current Fed Funds Rate: {analysis.get('current_fed_rate', 'N/A')}%
-            Fed Rate Change (YoY): {analysis.get('fed_rate_change_yoy', 'N/A')}%
-            Current 10Y Treasury: {analysis.get('current_10y_treasury', 'N/A')}%
-            Treasury Change (YoY): {analysis.get('treasury_change_yoy', 'N/A')}%
-            Yield Spread: {analysis.get('yield_spread', 'N/A')}%
-            Yield Curve: {analysis.get('yield_curve', 'N/A')}
-            Consumer Confidence: {analysis.get('current_consumer_confidence', 'N/A')}
-            Confidence Change (YoY): {analysis.get('confidence_change_yoy', 'N/A')}%
-            Industrial Production Index: {analysis.get('current_industrial_production', 'N/A')}
-            Production Change (YoY): {analysis.get('production_change_yoy', 'N/A')}%
-            
-            Provide insights on:
-            1. Labor market health and employment trends
-            2. Monetary policy stance and interest rate environment
-            3. Credit conditions and financial stability
-            4. Economic sentiment and business cycle position
-            5. Manufacturing and industrial activity
-            """
-            
-            response = self.llm.invoke([SystemMessage(content="You are an expert economic analyst specializing in market trends."), 
+            market_prompt = MARKET_ANALYSIS_PROMPT.format_map(PromptFields(analysis))
+            
+            response = await self._ainvoke_llm([self._system_msgs["market"], 
                                       HumanMessage(content=market_prompt)])
             analysis["ai_insights"] = response.content
             
-            state["market_analysis"] = analysis
-            state["messages"].append("✅ Market trends analysis completed")
+            return {"market_analysis": analysis, "messages": ["✅ Market trends analysis completed"]}
             
         except Exception as e:
             error_msg = f"Error in market trends analysis: {str(e)}"
-            if "error_messages" not in state:
-                state["error_messages"] = []
-            state["error_messages"].append(error_msg)
-            state["messages"].append(f"❌ {error_msg}")
-        
-        return state
+            return {"error_messages": [error_msg], "messages": [f"❌ {error_msg}"]}
     
-    def _analyze_industry_performance(self, state: EconomicAnalysisState) -> EconomicAnalysisState:
+    async def _analyze_industry_performance(self, state: EconomicAnalysisState) -> Dict[str, Any]:
         """Analyze industry-specific performance"""
         try:
-            if "industry" not in state["raw_data"]:
-                state["messages"].append("⚠️ No industry data available for analysis")
-                return state
+            raw_data = self._get_raw_data(state)
+            if "industry" not in raw_data:
+                return {"messages": ["⚠️ No industry data available for analysis"]}
                 
-            industry_data = state["raw_data"]["industry"]
+            industry_data = raw_data["industry"]
             focus_industries = state.get("focus_industries", EconomicConfig.FOCUS_INDUSTRIES)
             
             analysis = {}
@@ -443,87 +592,119 @@ class LangGraphEconomicAgent:
                     industry_analysis = {}
                     industry_info = industry_data[industry]
                     
-                    # Tech Industry Analysis
-                    if industry == "tech":
-                        if "tech_employment" in industry_info:
-                            current_emp = industry_info["tech_employment"].get_latest_value()
-                            emp_change = industry_info["tech_employment"].get_yoy_change()
-                            industry_analysis["employment"] = current_emp
-                            industry_analysis["employment_change_yoy"] = emp_change
-                        
-                        if "tech_wages" in industry_info:
-                            current_wages = industry_info["tech_wages"].get_latest_value()
-                            wage_change = industry_info["tech_wages"].get_yoy_change()
-                            industry_analysis["wages"] = current_wages
-                            industry_analysis["wage_change_yoy"] = wage_change
-                    
-                    # Healthcare Industry Analysis
-                    elif industry == "healthcare":
-                        if "healthcare_employment" in industry_info:
-                            current_emp = industry_info["healthcare_employment"].get_latest_value()
-                            emp_change = industry_info["healthcare_employment"].get_yoy_change()
-                            industry_analysis["employment"] = current_emp
-                            industry_analysis["employment_change_yoy"] = emp_change
-                        
-                        if "healthcare_cpi" in industry_info:
-                            current_cpi = industry_info["healthcare_cpi"].get_latest_value()
-                            cpi_change = industry_info["healthcare_cpi"].get_yoy_change()
-                            industry_analysis["healthcare_cpi"] = current_cpi
-                            industry_analysis["healthcare_cpi_change_yoy"] = cpi_change
-                    
-                    # Energy Industry Analysis
-                    elif industry == "energy":
-                        if "energy_employment" in industry_info:
-                            current_emp = industry_info["energy_employment"].get_latest_value()
-                            emp_change = industry_info["energy_employment"].get_yoy_change()
-                            industry_analysis["employment"] = current_emp
-                            industry_analysis["employment_change_yoy"] = emp_change
-                        
-                        if "oil_price" in industry_info:
-                            current_oil = industry_info["oil_price"].get_latest_value()
-                            oil_change = industry_info["oil_price"].get_yoy_change()
-                            industry_analysis["oil_price"] = current_oil
-                            industry_analysis["oil_price_change_yoy"] = oil_change
-                        
-                        if "natural_gas" in industry_info:
-                            current_gas = industry_info["natural_gas"].get_latest_value()
-                            gas_change = industry_info["natural_gas"].get_yoy_change()
-                            industry_analysis["natural_gas_price"] = current_gas
-                            industry_analysis["natural_gas_change_yoy"] = gas_change
-                    
-                    # AI-powered industry analysis
-                    industry_prompt = f"""
-                    Analyze the following {industry.upper()} industry performance data:
-                    
-                    {json.dumps(industry_analysis, indent=2)}
+                    for series_key, (level_field, yoy_field) in self.INDUSTRY_METRICS.get(industry, {}).items():
+                        if series_key in industry_info:
+                            industry_analysis[level_field] = industry_info[series_key].get_latest_value()
+                            industry_analysis[yoy_field] = industry_info[series_key].get_yoy_change()
                     
-                    Provide insights on:
-                    1. Industry health and growth trajectory
-                    2. Employment trends and labor market dynamics
-                    3. Key economic drivers and challenges
-                    4. Competitive position and outlook
-                    5. Policy implications and regulatory environment
-                    """
-                    
-                    response = self.llm.invoke([SystemMessage(content=f"You are an expert economic analyst specializing in {industry} industry analysis."), 
-                                              HumanMessage(content=industry_prompt)])
-                    industry_analysis["ai_insights"] = response.content
-                    
-                    analysis[industry] = industry_analysis
-            
-            state["industry_analysis"] = analysis
-            state["messages"].append("✅ Industry performance analysis completed")
+                    if industry_analysis:
+                        analysis[industry] = industry_analysis
+            
+            # Skip the LLM call when no focus industry has any indicators
+            if not analysis:
+                return {"messages": ["⚠️ No industry indicators available for analysis"]}
+            
+            # AI-powered industry analysis, several industries per JSON request
+            industries = list(analysis)
+            batches = [industries[i:i + self.INDUSTRY_BATCH_SIZE]
+                       for i in range(0, len(industries), self.INDUSTRY_BATCH_SIZE)]
+            batch_results = await asyncio.gather(*[
+                self._analyze_industry_batch({industry: analysis[industry] for industry in batch})
+                for batch in batches
+            ])
+            for batch_result in batch_results:
+                for industry, insights in batch_result.items():
+                    analysis[industry]["ai_insights"] = insights
+            
+            return {"industry_analysis": analysis, "messages": ["✅ Industry performance analysis completed"]}
             
         except Exception as e:
             error_msg = f"Error in industry analysis: {str(e)}"
-            if "error_messages" not in state:
-                state["error_messages"] = []
-            state["error_messages"].append(error_msg)
-            state["messages"].append(f"❌ {error_msg}")
+            return {"error_messages": [error_msg], "messages": [f"❌ {error_msg}"]}
+    
+    async def _analyze_industry_batch(self, industry_metrics: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """Analyze several industries in a single LLM request answered as a JSON object"""
+        industry_sections = "\n".join(
+            f"{industry.upper()} INDUSTRY:\n{self._format_for_prompt(metrics)}\n"
+            for industry, metrics in industry_metrics.items()
+        )
+        batch_prompt = INDUSTRY_BATCH_PROMPT.format_map(PromptFields(
+            industry_sections=industry_sections, industries=", ".join(industry_metrics)))
         
-        return state
+        # The prompt asks for JSON either way; JSON mode only guarantees it on models that support it
+        bind_kwargs = {}
+        if EconomicConfig.DEFAULT_MODEL.startswith(self.JSON_MODE_MODEL_PREFIXES):
+            bind_kwargs["response_format"] = {"type": "json_object"}
+        response = await self._ainvoke_llm(
+            [self._system_msgs["industry"],
+             HumanMessage(content=batch_prompt)],
+            **bind_kwargs)
+        
+        # Models don't always echo the keys exactly ("TECH", "Technology Industry"), so match them loosely
+        analyses = {}
+        for key, value in (self._parse_llm_json(response.content) or {}).items():
+            industry = self._match_industry(key, industry_metrics)
+            if industry and industry not in analyses:
+                analyses[industry] = self._json_to_text(value)
+        
+        # Without JSON mode the reply may be prose; look for a section per industry still missing
+        missing = [industry for industry in industry_metrics if industry not in analyses]
+        if missing:
+            analyses.update(self._split_industry_sections(response.content, industry_metrics, missing))
+        
+        if not analyses:
+            # Unparseable reply: keep the whole analysis for each industry rather than losing it
+            return {industry: response.content.strip() for industry in industry_metrics}
+        return {industry: analyses.get(industry, "No analysis available") for industry in industry_metrics}
+    
+    def _match_industry(self, key: Any, industries: Dict[str, Any]) -> Optional[str]:
+        """Industry a reply key refers to, ignoring case, separators and an industry/sector suffix"""
+        name = self.INDUSTRY_KEY_NOISE.sub("", str(key).lower())
+        return next((industry for industry in industries if name and name.startswith(industry)), None)
+    
+    def _split_industry_sections(self, content: str, industries: Dict[str, Any], wanted: List[str]) -> Dict[str, str]:
+        """Pull each wanted industry's section out of a prose reply with one heading per industry"""
+        # A heading line names the industry (optionally numbered, bold or suffixed) and ends in ":" or the line
+        names = "|".join(re.escape(industry) for industry in industries)
+        headings = list(re.finditer(
+            rf"^[\s#*\d.)-]*({names})\w*(?:\s+(?:industry|sector))?\**\s*(?::|$)",
+            content, re.IGNORECASE | re.MULTILINE))
+        sections = {}
+        for heading, next_heading in zip(headings, headings[1:] + [None]):
+            industry = heading.group(1).lower()
+            section = content[heading.end():next_heading.start() if next_heading else len(content)].strip(" *\n")
+            if industry in wanted and industry not in sections and section:
+                sections[industry] = section
+        return sections
+    
+    def _parse_llm_json(self, content: str) -> Optional[Dict[str, Any]]:
+        """Parse the JSON object in LLM output, or None if there is no valid object"""
+        match = self.JSON_OBJECT_PATTERN.search(content)
+        if not match:
+            return None
+        try:
+            results = orjson.loads(match.group()) if orjson is not None else json.loads(match.group())
+        except ValueError:  # orjson.JSONDecodeError is a ValueError too
+            return None
+        return results if isinstance(results, dict) else None
+    
+    @classmethod
+    def _json_to_text(cls, value: Any) -> str:
+        """Render a parsed JSON value as report text: keys as labels, lists as bullets"""
+        if isinstance(value, dict):
+            lines = []
+            for key, item in value.items():
+                label = str(key).replace('_', ' ').title()
+                if isinstance(item, (dict, list)):
+                    lines.append(f"{label}:\n{cls._json_to_text(item)}")
+                else:
+                    lines.append(f"{label}: {cls._json_to_text(item)}")
+            return "\n".join(lines)
+        if isinstance(value, list):
+            return "\n".join(f"- {cls._json_to_text(item)}" for item in value)
+        return str(value).strip()
     
-    def _generate_economic_insights(self, state: EconomicAnalysisState) -> EconomicAnalysisState:
+    async def _generate_economic_insights(self, state: EconomicAnalysisState) -> Dict[str, Any]:
         """Generate comprehensive economic insights"""
         try:
             # Combine all analyses
@@ -532,158 +713,108 @@ class LangGraphEconomicAgent:
             market_analysis = state.get("market_analysis", {})
             industry_analysis = state.get("industry_analysis", {})
             
-            # Create comprehensive analysis prompt
-            comprehensive_prompt = f"""
-            Based on the following economic data analysis, provide comprehensive economic insights:
+            # Create comprehensive analysis prompt from the metrics; the per-domain
+            # narratives go into the report as is and would only re-send prior LLM output
+            comprehensive_prompt = ECONOMIC_INSIGHTS_PROMPT.format_map(PromptFields(
+                gdp_analysis=self._format_for_prompt(gdp_analysis, metrics_only=True),
+                inflation_analysis=self._format_for_prompt(inflation_analysis, metrics_only=True),
+                market_analysis=self._format_for_prompt(market_analysis, metrics_only=True),
+                industry_analysis=self._format_for_prompt(industry_analysis, metrics_only=True)))
             
-            GDP ANALYSIS:
-            {json.dumps(gdp_analysis, indent=2, default=str)}
-            
-            INFLATION ANALYSIS:
-            {json.dumps(inflation_analysis, indent=2, default=str)}
-            
-            MARKET TRENDS ANALYSIS:
-            {json.dumps(market_analysis, indent=2, default=str)}
-            
-            INDUSTRY ANALYSIS:
-            {json.dumps(industry_analysis, indent=2, default=str)}
-            
-            Provide a comprehensive economic assessment including:
-            1. Overall economic health assessment
-            2. Key economic themes and patterns
-            3. Cross-indicator relationships and correlations
-            4. Economic cycle position and trajectory
-            5. Major risks and opportunities
-            6. Sector-specific insights and implications
-            7. Economic outlook and key factors to monitor
-            
-            Format your response as clear, actionable insights.
-            """
-            
-            response = self.llm.invoke([SystemMessage(content="You are a senior economic strategist providing comprehensive economic analysis."), 
+            response = await self._ainvoke_llm([self._system_msgs["insights"], 
                                       HumanMessage(content=comprehensive_prompt)])
             
             # Parse insights into structured format
-            insights = response.content.split('\n')
-            insights = [insight.strip() for insight in insights if insight.strip()]
+            insights = self.LINE_PATTERN.findall(response.content)
             
-            state["economic_insights"] = insights
-            state["messages"].append("✅ Comprehensive economic insights generated")
+            return {"economic_insights": insights,
+                    "messages": ["✅ Comprehensive economic insights generated"]}
             
         except Exception as e:
             error_msg = f"Error generating economic insights: {str(e)}"
-            if "error_messages" not in state:
-                state["error_messages"] = []
-            state["error_messages"].append(error_msg)
-            state["messages"].append(f"❌ {error_msg}")
-        
-        return state
+            return {"error_messages": [error_msg], "messages": [f"❌ {error_msg}"]}
     
-    def _create_visualizations(self, state: EconomicAnalysisState) -> EconomicAnalysisState:
+    def _create_visualizations(self, state: EconomicAnalysisState) -> Dict[str, Any]:
         """Create economic visualizations"""
+        if not EconomicConfig.RENDER_CHARTS:
+            return {"chart_paths": [], "messages": ["⚠️ Chart rendering disabled (RENDER_CHARTS=0)"]}
+        
         try:
-            raw_data = state["raw_data"]
+            raw_data = self._get_raw_data(state)
+            chart_dir = Path(EconomicConfig.CHART_OUTPUT_DIR)
+            run_tag = self._run_file_tag(state, datetime.now())  # shared by every chart in this batch
             chart_paths = []
-            
-            # Create economic dashboard (when both GDP and inflation are available)
-            if "gdp" in raw_data and "inflation" in raw_data:
-                fig = self.economic_agent.create_economic_dashboard_chart(
-                    raw_data["gdp"], raw_data["inflation"]
-                )
+            messages = []
+            
+            # Matplotlib charts to render: (file prefix, chart builder, data)
+            chart_tasks = []
+            if "gdp" in raw_data and "inflation" not in raw_data:
+                chart_tasks.append(("gdp_analysis", self._create_gdp_analysis_chart, raw_data["gdp"]))
+            elif "inflation" in raw_data and "gdp" not in raw_data:
+                chart_tasks.append(("inflation_analysis", self._create_inflation_analysis_chart, raw_data["inflation"]))
+            if "industry" in raw_data:
+                chart_tasks.append(("industry_comparison", self._create_industry_comparison_chart, raw_data["industry"]))
+            if "market" in raw_data:
+                chart_tasks.append(("market_trends", self._create_market_trends_chart, raw_data["market"]))
+            chart_tasks.append(("correlation_heatmap", self._create_correlation_heatmap, raw_data))
+            
+            # Kaleido renders the Plotly dashboard in its own subprocess, so export it on a thread
+            # while the matplotlib charts render here. These few charts draw faster than a
+            # process pool starts, so they render in this thread one after another.
+            with ThreadPoolExecutor(max_workers=1) as exporter:
+                dashboard = None
                 
-                chart_path = f"{EconomicConfig.CHART_OUTPUT_DIR}/economic_dashboard_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                try:
-                    fig.savefig(chart_path, dpi=300, bbox_inches='tight', facecolor='white')
-                    plt.close(fig)  # Close figure to free memory
-                    chart_paths.append(chart_path)
-                except Exception as e:
-                    state["messages"].append(f"⚠️ Chart export failed: {str(e)}")
-            
-            # Create GDP-specific chart (when only GDP data is available)
-            elif "gdp" in raw_data:
-                gdp_fig = self._create_gdp_analysis_chart(raw_data["gdp"])
-                if gdp_fig:
-                    chart_path = f"{EconomicConfig.CHART_OUTPUT_DIR}/gdp_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+                # Create economic dashboard (when both GDP and inflation are available)
+                if "gdp" in raw_data and "inflation" in raw_data:
+                    fig = self.economic_agent.create_economic_dashboard_chart(
+                        raw_data["gdp"], raw_data["inflation"]
+                    )
+                    chart_path = str(chart_dir / f"economic_dashboard_{run_tag}.{EconomicConfig.CHART_FORMAT}")
+                    dashboard = exporter.submit(self._export_dashboard, fig, chart_path)
+                
+                for name, builder, data in chart_tasks:
                     try:
-                        gdp_fig.savefig(chart_path, dpi=300, bbox_inches='tight', facecolor='white')
-                        plt.close(gdp_fig)  # Close figure to free memory
-                        chart_paths.append(chart_path)
+                        chart_paths.append(_render_chart(
+                            builder, data, str(chart_dir / f"{name}_{run_tag}.{EconomicConfig.CHART_FORMAT}")))
                     except Exception as e:
-                        state["messages"].append(f"⚠️ Chart export failed: {str(e)}")
-            
-            # Create inflation-specific chart (when only inflation data is available)
-            elif "inflation" in raw_data:
-                inflation_fig = self._create_inflation_analysis_chart(raw_data["inflation"])
-                if inflation_fig:
-                    chart_path = f"{EconomicConfig.CHART_OUTPUT_DIR}/inflation_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+                        messages.append(f"⚠️ Chart export failed: {str(e)}")
+                
+                if dashboard is not None:
                     try:
-                        inflation_fig.savefig(chart_path, dpi=300, bbox_inches='tight', facecolor='white')
-                        plt.close(inflation_fig)  # Close figure to free memory
-                        chart_paths.append(chart_path)
+                        chart_paths.insert(0, dashboard.result())
                     except Exception as e:
-                        state["messages"].append(f"⚠️ Chart export failed: {str(e)}")
+                        messages.append(f"⚠️ Chart export failed: {str(e)}")
             
-            # Create industry comparison chart
-            if "industry" in raw_data:
-                industry_fig = self._create_industry_comparison_chart(raw_data["industry"])
-                if industry_fig:
-                    chart_path = f"{EconomicConfig.CHART_OUTPUT_DIR}/industry_comparison_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                    try:
-                        industry_fig.savefig(chart_path, dpi=300, bbox_inches='tight', facecolor='white')
-                        plt.close(industry_fig)  # Close figure to free memory
-                        chart_paths.append(chart_path)
-                    except Exception as e:
-                        state["messages"].append(f"⚠️ Chart export failed: {str(e)}")
+            chart_paths = [chart_path for chart_path in chart_paths if chart_path]
             
-            # Create market trends chart
-            if "market" in raw_data:
-                market_fig = self._create_market_trends_chart(raw_data["market"])
-                if market_fig:
-                    chart_path = f"{EconomicConfig.CHART_OUTPUT_DIR}/market_trends_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                    try:
-                        market_fig.savefig(chart_path, dpi=300, bbox_inches='tight', facecolor='white')
-                        plt.close(market_fig)  # Close figure to free memory
-                        chart_paths.append(chart_path)
-                    except Exception as e:
-                        state["messages"].append(f"⚠️ Chart export failed: {str(e)}")
-            
-            # Create correlation heatmap
-            correlation_fig = self._create_correlation_heatmap(raw_data)
-            if correlation_fig:
-                chart_path = f"{EconomicConfig.CHART_OUTPUT_DIR}/correlation_heatmap_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                try:
-                    correlation_fig.savefig(chart_path, dpi=300, bbox_inches='tight', facecolor='white')
-                    plt.close(correlation_fig)  # Close figure to free memory
-                    chart_paths.append(chart_path)
-                except Exception as e:
-                    state["messages"].append(f"⚠️ Chart export failed: {str(e)}")
-            
-            state["chart_paths"] = chart_paths
-            state["messages"].append(f"✅ Created {len(chart_paths)} visualizations")
+            messages.append(f"✅ Created {len(chart_paths)} visualizations")
+            return {"chart_paths": chart_paths, "messages": messages}
             
         except Exception as e:
             error_msg = f"Error creating visualizations: {str(e)}"
-            if "error_messages" not in state:
-                state["error_messages"] = []
-            state["error_messages"].append(error_msg)
-            state["messages"].append(f"❌ {error_msg}")
-        
-        return state
+            return {"error_messages": [error_msg], "messages": [f"❌ {error_msg}"]}
     
-    def _create_industry_comparison_chart(self, industry_data: Dict[str, Any]) -> plt.Figure:
+    @staticmethod
+    def _export_dashboard(fig: Any, chart_path: str) -> str:
+        """Export the Plotly dashboard via Kaleido in the configured chart format"""
+        _start_kaleido_server()
+        # Render to bytes and write once rather than through Plotly's file writer
+        image_bytes = fig.to_image(format=EconomicConfig.CHART_FORMAT, width=1200, height=800, scale=2)
+        Path(chart_path).write_bytes(image_bytes)
+        return chart_path
+    
+    @staticmethod
+    def _create_industry_comparison_chart(industry_data: Dict[str, Any]) -> Figure:
         """Create professional industry performance comparison chart using matplotlib"""
         try:
-            # Set style for professional appearance
-            plt.style.use('seaborn-v0_8-whitegrid')
-            sns.set_palette("husl")
-            
             # Create figure with subplots
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+            fig = Figure(figsize=(15, 12))
+            (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
             fig.suptitle('Industry Performance Analysis Dashboard', fontsize=20, fontweight='bold', y=0.95)
             
-            industries = ["tech", "healthcare", "energy"]
-            industry_labels = ["Technology", "Healthcare", "Energy"]
-            colors = ['#2E86AB', '#A23B72', '#F18F01']  # Professional color palette
+            industries = LangGraphEconomicAgent.CHART_INDUSTRIES
+            industry_labels = LangGraphEconomicAgent.CHART_INDUSTRY_LABELS
+            colors = LangGraphEconomicAgent.CHART_INDUSTRY_COLORS
             
             employment_changes = []
             wage_changes = []
@@ -733,7 +864,7 @@ class LangGraphEconomicAgent:
                         f'{value:.1f}%', ha='center', va='bottom' if height >= 0 else 'top', fontweight='bold')
             
             # 2. Wage Growth Chart (Top Right)
-            bars2 = ax2.bar(industry_labels, wage_changes, color=[color.replace('AB', '72') for color in colors], 
+            bars2 = ax2.bar(industry_labels, wage_changes, color=LangGraphEconomicAgent.CHART_WAGE_COLORS, 
                            alpha=0.8, edgecolor='white', linewidth=2)
             ax2.set_title('Wage Growth (YoY %)', fontsize=14, fontweight='bold')
             ax2.set_ylabel('Wage Growth (%)', fontsize=12)
@@ -791,21 +922,20 @@ class LangGraphEconomicAgent:
             fig.text(0.5, 0.02, 'Data Source: Federal Reserve Economic Data (FRED)', 
                     ha='center', fontsize=10, color='gray', style='italic')
             
-            plt.tight_layout()
+            fig.tight_layout()
             return fig
             
         except Exception as e:
             print(f"Error creating industry comparison chart: {str(e)}")
             return None
     
-    def _create_gdp_analysis_chart(self, gdp_data: Dict[str, Any]) -> plt.Figure:
+    @staticmethod
+    def _create_gdp_analysis_chart(gdp_data: Dict[str, Any]) -> Figure:
         """Create professional GDP analysis chart using matplotlib"""
         try:
-            # Set style for professional appearance
-            plt.style.use('seaborn-v0_8-whitegrid')
-            
             # Create figure with subplots
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+            fig = Figure(figsize=(15, 12))
+            (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
             fig.suptitle('GDP Analysis Dashboard', fontsize=20, fontweight='bold', y=0.95)
             
             # Color scheme for professional look
@@ -828,7 +958,7 @@ class LangGraphEconomicAgent:
                 ax1.tick_params(axis='x', rotation=45)
                 
                 # Format y-axis to show values in billions
-                ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}B'))
+                ax1.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'${x:,.0f}B'))
             
             # 2. GDP Growth Rate (Top Right)
             if "gdp_growth" in gdp_data and gdp_data["gdp_growth"]:
@@ -859,7 +989,7 @@ class LangGraphEconomicAgent:
                 ax3.tick_params(axis='x', rotation=45)
                 
                 # Format y-axis to show values in thousands
-                ax3.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
+                ax3.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'${x:,.0f}'))
             
             # 4. GDP Components Analysis (Bottom Right) - Placeholder
             ax4.text(0.5, 0.5, 'GDP Components Analysis\n(Future Enhancement)', 
@@ -872,21 +1002,20 @@ class LangGraphEconomicAgent:
             fig.text(0.5, 0.02, 'Data Source: Federal Reserve Economic Data (FRED)', 
                     ha='center', fontsize=10, color='gray', style='italic')
             
-            plt.tight_layout()
+            fig.tight_layout()
             return fig
             
         except Exception as e:
             print(f"Error creating GDP analysis chart: {str(e)}")
             return None
     
-    def _create_inflation_analysis_chart(self, inflation_data: Dict[str, Any]) -> plt.Figure:
+    @staticmethod
+    def _create_inflation_analysis_chart(inflation_data: Dict[str, Any]) -> Figure:
         """Create professional inflation analysis chart using matplotlib"""
         try:
-            # Set style for professional appearance
-            plt.style.use('seaborn-v0_8-whitegrid')
-            
             # Create figure with subplots
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+            fig = Figure(figsize=(15, 12))
+            (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
             fig.suptitle('Inflation Analysis Dashboard', fontsize=20, fontweight='bold', y=0.95)
             
             # Color scheme for professional look
@@ -897,7 +1026,7 @@ class LangGraphEconomicAgent:
                 'inflation_rate': '#F39C12'
             }
             
-            # 1. Consumer Price Index (Top Left)
+            # 1. Consumer Price Index (Top Left), also the headline line in the Top Right panel
             if "cpi" in inflation_data and inflation_data["cpi"]:
                 cpi_data = inflation_data["cpi"]
                 dates = cpi_data.data.index
@@ -909,15 +1038,10 @@ class LangGraphEconomicAgent:
                 ax1.grid(True, alpha=0.3)
                 ax1.tick_params(axis='x', rotation=45)
                 ax1.legend()
-            
-            # 2. Core CPI vs Headline CPI (Top Right)
-            if "cpi" in inflation_data and inflation_data["cpi"]:
-                cpi_data = inflation_data["cpi"]
-                dates = cpi_data.data.index
-                values = cpi_data.data.values
                 
                 ax2.plot(dates, values, color=colors['cpi'], linewidth=3, marker='o', markersize=4, label='Headline CPI')
             
+            # 2. Core CPI vs Headline CPI (Top Right)
             if "core_cpi" in inflation_data and inflation_data["core_cpi"]:
                 core_cpi_data = inflation_data["core_cpi"]
                 dates = core_cpi_data.data.index
@@ -966,21 +1090,20 @@ class LangGraphEconomicAgent:
             fig.text(0.5, 0.02, 'Data Source: Federal Reserve Economic Data (FRED)', 
                     ha='center', fontsize=10, color='gray', style='italic')
             
-            plt.tight_layout()
+            fig.tight_layout()
             return fig
             
         except Exception as e:
             print(f"Error creating inflation analysis chart: {str(e)}")
             return None
     
-    def _create_market_trends_chart(self, market_data: Dict[str, Any]) -> plt.Figure:
+    @staticmethod
+    def _create_market_trends_chart(market_data: Dict[str, Any]) -> Figure:
         """Create professional market trends analysis chart using matplotlib"""
         try:
-            # Set style for professional appearance
-            plt.style.use('seaborn-v0_8-whitegrid')
-            
             # Create figure with subplots
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+            fig = Figure(figsize=(15, 12))
+            (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
             fig.suptitle('Market Trends Analysis Dashboard', fontsize=20, fontweight='bold', y=0.95)
             
             # Color scheme for professional look
@@ -1062,57 +1185,59 @@ class LangGraphEconomicAgent:
             fig.text(0.5, 0.02, 'Data Source: Federal Reserve Economic Data (FRED)', 
                     ha='center', fontsize=10, color='gray', style='italic')
             
-            plt.tight_layout()
+            fig.tight_layout()
             return fig
             
         except Exception as e:
             print(f"Error creating market trends chart: {str(e)}")
             return None
     
-    def _create_correlation_heatmap(self, raw_data: Dict[str, Any]) -> plt.Figure:
+    @staticmethod
+    def _create_correlation_heatmap(raw_data: Dict[str, Any]) -> Figure:
         """Create professional correlation heatmap of economic indicators using matplotlib/seaborn"""
         try:
+            # A matrix of one or two indicators carries at most a single coefficient, so skip the chart
+            if sum(len(raw_data.get(category, {})) for category in ("gdp", "inflation", "market")) < 3:
+                return None
+            
+            import seaborn as sns  # only the heatmap needs seaborn
+            
             # Combine key economic indicators
             combined_data = {}
             
             # GDP indicators
             if "gdp" in raw_data:
                 for key, econ_data in raw_data["gdp"].items():
-                    if econ_data and econ_data.data is not None:
+                    if econ_data:
                         combined_data[f"GDP_{key}"] = econ_data.data
             
             # Inflation indicators
             if "inflation" in raw_data:
                 for key, econ_data in raw_data["inflation"].items():
-                    if econ_data and econ_data.data is not None:
+                    if econ_data:
                         combined_data[f"Inflation_{key}"] = econ_data.data
             
             # Market indicators
             if "market" in raw_data:
                 for key, econ_data in raw_data["market"].items():
-                    if econ_data and econ_data.data is not None:
+                    if econ_data:
                         combined_data[f"Market_{key}"] = econ_data.data
             
-            if len(combined_data) > 1:
-                df = pd.DataFrame(combined_data)
-                correlation_matrix = df.corr()
+            # Some fetched series may still be empty
+            if len(combined_data) > 2:
+                # Align every series on the union of their dates; gaps stay NaN for pairwise correlation
+                dates = functools.reduce(pd.Index.union, (series.index for series in combined_data.values()))
+                values = np.empty((len(dates), len(combined_data)), dtype=np.float64)
+                for j, series in enumerate(combined_data.values()):
+                    values[:, j] = series.reindex(dates).to_numpy(dtype=np.float64)
                 
                 # Clean up column names for better display
-                clean_names = {}
-                for col in correlation_matrix.columns:
-                    if 'GDP_' in col:
-                        clean_names[col] = col.replace('GDP_', 'GDP ').replace('_', ' ').title()
-                    elif 'Inflation_' in col:
-                        clean_names[col] = col.replace('Inflation_', 'Inflation ').replace('_', ' ').title()
-                    elif 'Market_' in col:
-                        clean_names[col] = col.replace('Market_', 'Market ').replace('_', ' ').title()
-                    else:
-                        clean_names[col] = col.replace('_', ' ').title()
-                
-                correlation_matrix = correlation_matrix.rename(columns=clean_names, index=clean_names)
+                labels = pd.Index(list(combined_data)).str.replace('_', ' ', regex=False).str.title()
+                correlation_matrix = pd.DataFrame(_pairwise_corr(values), index=labels, columns=labels)
                 
                 # Create figure
-                fig, ax = plt.subplots(figsize=(12, 10))
+                fig = Figure(figsize=(12, 10))
+                ax = fig.subplots()
                 
                 # Create heatmap using seaborn
                 mask = np.triu(np.ones_like(correlation_matrix, dtype=bool))  # Mask upper triangle
@@ -1129,21 +1254,21 @@ class LangGraphEconomicAgent:
                 ax.set_title('Economic Indicators Correlation Matrix', fontsize=18, fontweight='bold', pad=20)
                 
                 # Rotate x-axis labels for better readability
-                plt.xticks(rotation=45, ha='right')
-                plt.yticks(rotation=0)
+                ax.set_xticklabels(ax.get_xticklabels(), rotation=45, ha='right')
+                ax.tick_params(axis='y', labelrotation=0)
                 
                 # Add data source annotation
                 fig.text(0.5, 0.02, 'Data Source: Federal Reserve Economic Data (FRED)', 
                         ha='center', fontsize=10, color='gray', style='italic')
                 
-                plt.tight_layout()
+                fig.tight_layout()
                 return fig
             
         except Exception as e:
             print(f"Error creating correlation heatmap: {str(e)}")
             return None
     
-    def _analyze_policy_implications(self, state: EconomicAnalysisState) -> EconomicAnalysisState:
+    async def _analyze_policy_implications(self, state: EconomicAnalysisState) -> Dict[str, Any]:
         """Analyze policy implications"""
         try:
             economic_insights = state.get("economic_insights", [])
@@ -1151,50 +1276,24 @@ class LangGraphEconomicAgent:
             inflation_analysis = state.get("inflation_analysis", {})
             market_analysis = state.get("market_analysis", {})
             
-            policy_prompt = f"""
-            Based on the current economic conditions, analyze policy implications:
-            
-            CURRENT ECONOMIC STATE:
-            - GDP Growth: {gdp_analysis.get('current_growth_rate', 'N/A')}%
-            - Inflation Rate: {inflation_analysis.get('current_inflation_rate', 'N/A')}%
-            - Unemployment: {market_analysis.get('current_unemployment', 'N/A')}%
-            - Fed Funds Rate: {market_analysis.get('current_fed_rate', 'N/A')}%
-            - Yield Curve: {market_analysis.get('yield_curve', 'N/A')}
-            
-            ECONOMIC INSIGHTS:
-            {chr(10).join(economic_insights[:10])}
-            
-            Provide policy analysis covering:
-            1. Monetary Policy Implications
-            2. Fiscal Policy Considerations
-            3. Regulatory Policy Recommendations
-            4. Industry-Specific Policy Needs
-            5. International Trade and Policy Coordination
-            6. Risk Management and Contingency Planning
-            
-            Focus on actionable policy recommendations.
-            """
+            policy_prompt = POLICY_IMPLICATIONS_PROMPT.format_map(PromptFields(
+                {**gdp_analysis, **inflation_analysis, **market_analysis},
+                economic_insights="\n".join(self._key_points(economic_insights, 10))))
             
-            response = self.llm.invoke([SystemMessage(content="You are an expert policy economist advising on macroeconomic policy."), 
+            response = await self._ainvoke_llm([self._system_msgs["policy"], 
                                       HumanMessage(content=policy_prompt)])
             
             # Parse policy implications
-            policy_implications = response.content.split('\n')
-            policy_implications = [policy.strip() for policy in policy_implications if policy.strip()]
+            policy_implications = self.LINE_PATTERN.findall(response.content)
             
-            state["policy_implications"] = policy_implications
-            state["messages"].append("✅ Policy implications analysis completed")
+            return {"policy_implications": policy_implications,
+                    "messages": ["✅ Policy implications analysis completed"]}
             
         except Exception as e:
             error_msg = f"Error analyzing policy implications: {str(e)}"
-            if "error_messages" not in state:
-                state["error_messages"] = []
-            state["error_messages"].append(error_msg)
-            state["messages"].append(f"❌ {error_msg}")
-        
-        return state
+            return {"error_messages": [error_msg], "messages": [f"❌ {error_msg}"]}
     
-    def _generate_forecasts(self, state: EconomicAnalysisState) -> EconomicAnalysisState:
+    async def _generate_forecasts(self, state: EconomicAnalysisState) -> Dict[str, Any]:
         """Generate economic forecasts"""
         try:
             # Get all analysis data
@@ -1204,34 +1303,12 @@ class LangGraphEconomicAgent:
             industry_analysis = state.get("industry_analysis", {})
             economic_insights = state.get("economic_insights", [])
             
-            forecast_prompt = f"""
-            Based on comprehensive economic analysis, provide forward-looking forecasts:
-            
-            CURRENT ECONOMIC METRICS:
-            - GDP Growth: {gdp_analysis.get('current_growth_rate', 'N/A')}%
-            - Inflation: {inflation_analysis.get('current_inflation_rate', 'N/A')}%
-            - Unemployment: {market_analysis.get('current_unemployment', 'N/A')}%
-            - Fed Funds Rate: {market_analysis.get('current_fed_rate', 'N/A')}%
-            - Consumer Confidence: {market_analysis.get('current_consumer_confidence', 'N/A')}
-            
-            ECONOMIC TRENDS:
-            {chr(10).join(economic_insights[:8])}
-            
-            INDUSTRY PERFORMANCE:
-            {json.dumps(industry_analysis, indent=2, default=str)[:1000]}...
-            
-            Provide 6-month and 12-month forecasts for:
-            1. GDP Growth Rate
-            2. Inflation Rate
-            3. Unemployment Rate
-            4. Interest Rates (Fed Funds & 10Y Treasury)
-            5. Industry Performance (Tech, Healthcare, Energy)
-            6. Key Economic Risks and Opportunities
-            
-            Include confidence levels and key assumptions for each forecast.
-            """
+            forecast_prompt = FORECAST_PROMPT.format_map(PromptFields(
+                {**gdp_analysis, **inflation_analysis, **market_analysis},
+                economic_insights="\n".join(self._key_points(economic_insights, 8)),
+                industry_performance=self._format_for_prompt(industry_analysis, metrics_only=True)))
             
-            response = self.llm.invoke([SystemMessage(content="You are an expert economic forecaster with deep knowledge of economic cycles and trends."), 
+            response = await self._ainvoke_llm([self._system_msgs["forecasts"], 
                                       HumanMessage(content=forecast_prompt)])
             
             # Structure forecast data
@@ -1244,83 +1321,84 @@ class LangGraphEconomicAgent:
                 "ai_forecast_analysis": response.content
             }
             
-            state["forecasts"] = forecasts
-            state["messages"].append("✅ Economic forecasts generated")
+            return {"forecasts": forecasts, "messages": ["✅ Economic forecasts generated"]}
             
         except Exception as e:
             error_msg = f"Error generating forecasts: {str(e)}"
-            if "error_messages" not in state:
-                state["error_messages"] = []
-            state["error_messages"].append(error_msg)
-            state["messages"].append(f"❌ {error_msg}")
-        
-        return state
+            return {"error_messages": [error_msg], "messages": [f"❌ {error_msg}"]}
     
-    def _generate_final_report(self, state: EconomicAnalysisState) -> EconomicAnalysisState:
+    def _generate_final_report(self, state: EconomicAnalysisState) -> Dict[str, Any]:
         """Generate comprehensive final report"""
+        # Last node of the run; analyses and charts are done with the raw data
+        self._raw_data.pop(state.get("raw_data_id", ""), None)
         try:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            report_filename = f"{EconomicConfig.REPORT_OUTPUT_DIR}/economic_analysis_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-            
-            # Compile comprehensive report
-            report_content = f"""# Economic Analysis Report
-Generated on: {timestamp}
-
-## Executive Summary
-
-### Key Economic Indicators
-{self._format_analysis_summary(state)}
-
-### Economic Insights
-{chr(10).join([f"- {insight}" for insight in state.get('economic_insights', [])[:10]])}
-
-## Detailed Analysis
-
-### GDP Analysis
-{state.get('gdp_analysis', {}).get('ai_insights', 'No GDP analysis available')}
-
-### Inflation Analysis
-{state.get('inflation_analysis', {}).get('ai_insights', 'No inflation analysis available')}
-
-### Market Trends Analysis
-{state.get('market_analysis', {}).get('ai_insights', 'No market analysis available')}
-
-### Industry Performance Analysis
-{self._format_industry_analysis(state.get('industry_analysis', {}))}
-
-## Policy Implications
-{chr(10).join([f"- {policy}" for policy in state.get('policy_implications', [])[:10]])}
-
-## Economic Forecasts
-{state.get('forecasts', {}).get('ai_forecast_analysis', 'No forecasts available')}
-
-## Charts and Visualizations
-Generated charts:
-{chr(10).join([f"- {chart}" for chart in state.get('chart_paths', [])])}
-
-## Data Sources
-- Federal Reserve Economic Data (FRED)
-- Analysis Period: {state.get('period', 'N/A')}
-- Focus Industries: {', '.join(state.get('focus_industries', []))}
-
----
-*Report generated by LangGraph Economic Analysis System*
-"""
-            
-            # Save report
-            with open(report_filename, 'w', encoding='utf-8') as f:
-                f.write(report_content)
+            now = datetime.now()
+            timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
+            report_filename = str(Path(EconomicConfig.REPORT_OUTPUT_DIR) / f"economic_analysis_report_{self._run_file_tag(state, now)}.txt")
+            gdp_insights = state.get('gdp_analysis', {}).get('ai_insights', 'No GDP analysis available')
+            inflation_insights = state.get('inflation_analysis', {}).get('ai_insights', 'No inflation analysis available')
+            market_insights = state.get('market_analysis', {}).get('ai_insights', 'No market analysis available')
+            forecast_analysis = state.get('forecasts', {}).get('ai_forecast_analysis', 'No forecasts available')
+            
+            # Write the report section by section rather than building it as one string;
+            # it goes to a temp file first so readers never see a partial report
+            temp_filename = f"{report_filename}.tmp"
+            with open(temp_filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(f"# Economic Analysis Report\nGenerated on: {timestamp}\n\n")
+                f.write("## Executive Summary\n\n")
+                f.write(f"### Key Economic Indicators\n{self._format_analysis_summary(state)}\n\n")
+                f.write("### Economic Insights\n")
+                f.writelines(f"- {insight}\n" for insight in state.get('economic_insights', [])[:10])
+                
+                f.write("\n## Detailed Analysis\n\n")
+                f.write(f"### GDP Analysis\n{gdp_insights}\n\n")
+                f.write(f"### Inflation Analysis\n{inflation_insights}\n\n")
+                f.write(f"### Market Trends Analysis\n{market_insights}\n\n")
+                f.write(f"### Industry Performance Analysis\n{self._format_industry_analysis(state.get('industry_analysis', {}))}\n\n")
+                
+                f.write("## Policy Implications\n")
+                f.writelines(f"- {policy}\n" for policy in state.get('policy_implications', [])[:10])
+                f.write(f"\n## Economic Forecasts\n{forecast_analysis}\n\n")
+                
+                f.write("## Charts and Visualizations\nGenerated charts:\n")
+                f.writelines(f"- {chart}\n" for chart in state.get('chart_paths', []))
+                
+                f.write("\n## Data Sources\n- Federal Reserve Economic Data (FRED)\n")
+                f.write(f"- Analysis Period: {state.get('period', 'N/A')}\n")
+                f.write(f"- Focus Industries: {', '.join(state.get('focus_industries', []))}\n\n")
+                f.write("---\n*Report generated by LangGraph Economic Analysis System*\n")
+            os.replace(temp_filename, report_filename)
             
-            state["messages"].append(f"✅ Final report generated: {report_filename}")
+            return {"messages": [f"✅ Final report generated: {report_filename}"]}
             
         except Exception as e:
             error_msg = f"Error generating final report: {str(e)}"
-            if "error_messages" not in state:
-                state["error_messages"] = []
-            state["error_messages"].append(error_msg)
-            state["messages"].append(f"❌ {error_msg}")
+            return {"error_messages": [error_msg], "messages": [f"❌ {error_msg}"]}
+    
+    def _format_for_prompt(self, data: Any, max_points: int = 12, metrics_only: bool = False) -> str:
+        """Serialize analysis data compactly for an LLM prompt"""
+        def _compact(value):
+            if isinstance(value, dict):
+                return {k: _compact(v) for k, v in value.items()
+                        if v is not None and not (isinstance(v, float) and np.isnan(v))
+                        and not (metrics_only and k == "ai_insights")}
+            if isinstance(value, (list, tuple)):
+                return [_compact(v) for v in value[-max_points:]]
+            if isinstance(value, (float, np.floating)):
+                return round(float(value), 2)
+            if isinstance(value, np.integer):
+                return int(value)
+            return value
         
-        return state
+        # No indentation and rounded numbers keep prompt tokens down
+        if orjson is not None:
+            return orjson.dumps(_compact(data), default=str, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        return json.dumps(_compact(data), separators=(",", ":"), default=str)
+    
+    def _key_points(self, lines: List[str], limit: int) -> List[str]:
+        """Pick the first bullet or numbered points from LLM output lines"""
+        points = [match.group(1) for match in map(self.KEY_POINT_PATTERN.match, lines) if match]
+        return (points or lines)[:limit]
     
     def _format_analysis_summary(self, state: EconomicAnalysisState) -> str:
         """Format key metrics summary"""
@@ -1339,17 +1417,14 @@ Generated charts:
     
     def _format_industry_analysis(self, industry_analysis: Dict[str, Any]) -> str:
         """Format industry analysis section"""
-        formatted = ""
-        for industry, analysis in industry_analysis.items():
-            formatted += f"\n#### {industry.upper()} Industry\n"
-            formatted += analysis.get('ai_insights', 'No analysis available')
-            formatted += "\n"
-        return formatted
+        return "".join(f"\n#### {industry.upper()} Industry\n{analysis.get('ai_insights', 'No analysis available')}\n"
+                       for industry, analysis in industry_analysis.items())
     
-    def run_analysis(self, analysis_type: str = "comprehensive", 
-                    period: str = "10y",
-                    focus_industries: List[str] = None) -> Dict[str, Any]:
-        """Run the complete economic analysis workflow"""
+    async def arun_analysis(self, analysis_type: str = "comprehensive",
+                            period: str = "10y",
+                            focus_industries: List[str] = None,
+                            on_token: Optional[Callable[[str, str], None]] = None) -> Dict[str, Any]:
+        """Run the complete economic analysis workflow asynchronously"""
         if focus_industries is None:
             focus_industries = EconomicConfig.FOCUS_INDUSTRIES
         
@@ -1357,7 +1432,7 @@ Generated charts:
             "analysis_type": analysis_type,
             "period": period,
             "focus_industries": focus_industries,
-            "raw_data": {},
+            "raw_data_id": "",
             "gdp_analysis": {},
             "inflation_analysis": {},
             "market_analysis": {},
@@ -1370,12 +1445,52 @@ Generated charts:
             "error_messages": []
         }
         
-        # Run the workflow
-        final_state = self.graph.invoke(initial_state)
+        # Run the workflow, forwarding tokens from the narrative nodes as they arrive
+        if on_token is None:
+            final_state = await self.graph.ainvoke(initial_state)
+        else:
+            final_state = initial_state
+            async for mode, payload in self.graph.astream(initial_state, stream_mode=["messages", "values"]):
+                if mode == "values":
+                    final_state = payload
+                    continue
+                chunk, metadata = payload
+                node = metadata.get("langgraph_node")
+                if node in self.STREAMED_NODES and chunk.content:
+                    on_token(node, chunk.content)
         
         # Ensure analysis_type is preserved in the result
         final_state["analysis_type"] = analysis_type
         final_state["period"] = period
         final_state["focus_industries"] = focus_industries
         
-        return final_state
\ No newline at end of file
+        return final_state
+    
+    def run_analysis(self, analysis_type: str = "comprehensive", 
+                    period: str = "10y",
+                    focus_industries: List[str] = None,
+                    on_token: Optional[Callable[[str, str], None]] = None) -> Dict[str, Any]:
+        """Run the complete economic analysis workflow"""
+        return self._run_sync(self.arun_analysis(analysis_type, period, focus_industries, on_token))
+    
+    async def arun_analyses(self, specs: List[tuple]) -> List[Dict[str, Any]]:
+        """Run several (analysis_type, period, focus_industries) analyses concurrently"""
+        # Runs share the compiled graph and the per-loop LLM semaphore, so total LLM load stays bounded
+        return await asyncio.gather(*(self.arun_analysis(analysis_type, period, focus_industries)
+                                      for analysis_type, period, focus_industries in specs))
+    
+    def run_analyses(self, specs: List[tuple]) -> List[Dict[str, Any]]:
+        """Run several economic analyses concurrently, returning results in spec order"""
+        return self._run_sync(self.arun_analyses(specs))
+    
+    @staticmethod
+    def _run_sync(coro):
+        """Run a coroutine to completion from synchronous code"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        # asyncio.run can't nest inside a running loop (e.g. Jupyter), so give it its own thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
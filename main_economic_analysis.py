@@ -1,9 +1,14 @@
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from langgraph_economic_agent import LangGraphEconomicAgent
+from typing import TYPE_CHECKING
 from economic_config import EconomicConfig
-from economic_report_writer import EconomicReportWriter
+
+# The agent and report writer pull in LangGraph, LangChain and the plotting stack, so the
+# entry points import them when they run and the usage path stays fast
+if TYPE_CHECKING:
+    from langgraph_economic_agent import LangGraphEconomicAgent
 
 def main():
     """Main execution function"""
@@ -17,6 +22,7 @@ def main():
         
         # Initialize the economic agent
         print("🚀 Initializing LangGraph Economic Agent...")
+        from langgraph_economic_agent import LangGraphEconomicAgent
         agent = LangGraphEconomicAgent()
         print("✅ Agent initialized successfully")
         
@@ -35,11 +41,16 @@ def main():
         print("3. Inflation Analysis (5 years)")
         print("4. Market Trends Analysis (3 years)")
         print("5. Industry Performance Analysis (5 years)")
+        print("6. Batch: Comprehensive, GDP, Inflation and Market Trends together")
         
-        choice = input("\nEnter your choice (1-5) or press Enter for comprehensive: ").strip()
+        choice = input("\nEnter your choice (1-6) or press Enter for comprehensive: ").strip()
         if not choice:
             choice = "1"
         
+        if choice == "6":
+            run_batch_analysis(agent, [analysis_options[key] for key in ("1", "2", "3", "4")])
+            return
+        
         if choice not in analysis_options:
             print("❌ Invalid choice. Running comprehensive analysis...")
             choice = "1"
@@ -116,6 +127,34 @@ def main():
         print("3. Ensure all required packages are installed")
         sys.exit(1)
 
+def run_batch_analysis(agent: "LangGraphEconomicAgent", specs: list):
+    """Run several analyses concurrently on one agent and summarize each"""
+    print(f"\n🔍 Running {len(specs)} analyses concurrently...")
+    print("⏳ This may take a few minutes...\n")
+    
+    start_time = datetime.now()
+    results = agent.run_analyses(specs)
+    duration = (datetime.now() - start_time).seconds
+    
+    print("\n" + "=" * 50)
+    print("📋 BATCH ANALYSIS COMPLETE")
+    print("=" * 50)
+    print(f"⏱️  Total Duration: {duration} seconds")
+    
+    for (analysis_type, period, _), result in zip(specs, results):
+        print(f"\n📊 {analysis_type.upper()} ({period})")
+        for error in result.get("error_messages", []):
+            print(f"  ❌ {error}")
+        for i, insight in enumerate(result.get("economic_insights", [])[:3], 1):
+            print(f"  {i}. {insight}")
+        for chart in result.get("chart_paths", []):
+            print(f"  📈 {chart}")
+    
+    print("\n" + "=" * 50)
+    print("✅ Batch economic analysis completed!")
+    print("📁 Check the 'economic_reports' and 'economic_charts' directories for detailed outputs.")
+    print("=" * 50)
+
 def run_custom_analysis():
     """Run custom analysis with user-defined parameters"""
     print("🛠️  Custom Economic Analysis")
@@ -123,6 +162,8 @@ def run_custom_analysis():
     
     try:
         # Initialize agents
+        from langgraph_economic_agent import LangGraphEconomicAgent
+        from economic_report_writer import EconomicReportWriter
         agent = LangGraphEconomicAgent()
         report_writer = EconomicReportWriter()
         
@@ -155,17 +196,19 @@ def run_custom_analysis():
             focus_industries=focus_industries
         )
         
-        # Phase 2: Report Generation
+        # Phase 2: Report Generation and dashboard; both only read the analysis result, so run them together
         print("📝 Generating report...")
-        report_data = report_writer.generate_comprehensive_report(
-            result,
-            report_type=report_type,
-            custom_focus=focus_industries if report_type == "sector_focus" else None
-        )
-        
-        # Generate dashboard
         print("📊 Creating executive dashboard...")
-        dashboard_path = report_writer.create_executive_dashboard(result)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            report_future = executor.submit(
+                report_writer.generate_comprehensive_report,
+                result,
+                report_type=report_type,
+                custom_focus=focus_industries if report_type == "sector_focus" else None
+            )
+            dashboard_future = executor.submit(report_writer.create_executive_dashboard, result)
+            report_data = report_future.result()
+            dashboard_path = dashboard_future.result()
         
         print("\n✅ Custom analysis completed!")
         print(f"📊 Generated {len(result.get('chart_paths', []))} visualizations")
@@ -188,6 +231,8 @@ def run_with_real_data():
         
         # Initialize the economic agent
         print("🚀 Initializing LangGraph Economic Agent...")
+        from langgraph_economic_agent import LangGraphEconomicAgent
+        from economic_report_writer import EconomicReportWriter
         agent = LangGraphEconomicAgent()
         print("✅ Agent initialized successfully")
         
@@ -214,11 +259,14 @@ def run_with_real_data():
         # Phase 2: Generate focused report with real data based on analysis type
         analysis_type = result.get("analysis_type", "comprehensive")
         print(f"\n📝 Generating {analysis_type} report with real data...")
-        report_data = report_writer.generate_comprehensive_report(result, analysis_type)
         
-        # Phase 3: Create executive dashboard with real data
+        # Phase 3: Create executive dashboard with real data, alongside the report
         print("📊 Creating executive dashboard with real data...")
-        dashboard_path = report_writer.create_executive_dashboard(result)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            report_future = executor.submit(report_writer.generate_comprehensive_report, result, analysis_type)
+            dashboard_future = executor.submit(report_writer.create_executive_dashboard, result)
+            report_data = report_future.result()
+            dashboard_path = dashboard_future.result()
         
         end_time = datetime.now()
         duration = (end_time - start_time).seconds